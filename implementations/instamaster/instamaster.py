@@ -2,31 +2,464 @@
 # but in Colab, it's good practice to ensure they are installed.
 # !pip install librosa soundfile numpy scipy
 
+import functools
+import math
+import os
+import sys
+
 import soundfile as sf
 import numpy as np
-from scipy.signal import butter, lfilter
+from scipy.signal import butter, sosfilt
 
 # from google.colab import files # Will be imported conditionally later
 import io  # For handling byte streams
 
 # import sys # For checking if running in Colab
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional: kernels fall back to plain Python loops
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _compressor_kernel(
+    audio,
+    attack_coeff,
+    release_coeff,
+    threshold,
+    makeup_gain,
+    inv_ratio,
+    gain_state,
+    out,
+):
+    """
+    Per-sample compressor gain computer (attack/release envelope follower).
+
+    Takes a (channels, N) band and runs one envelope per channel in parallel.
+    Each envelope starts from and is written back to gain_state[ch], so
+    consecutive blocks continue seamlessly. The band, times its envelope and
+    the makeup gain, is added to out in the same pass, so bands can be summed
+    without materialising an envelope or a compressed copy of each one.
+    """
+    one_minus_attack = 1.0 - attack_coeff
+    one_minus_release = 1.0 - release_coeff
+
+    for ch in prange(audio.shape[0]):
+        current_gain = gain_state[ch]
+        for i_sample in range(audio.shape[1]):
+            instant_level = abs(audio[ch, i_sample])
+            target_gain_reduction = 1.0
+            if instant_level > threshold and threshold > 0:
+                target_gain_reduction = (
+                    threshold + (instant_level - threshold) * inv_ratio
+                ) / instant_level
+
+            if target_gain_reduction < current_gain:
+                current_gain = (
+                    one_minus_attack * target_gain_reduction
+                    + attack_coeff * current_gain
+                )
+            else:
+                current_gain = (
+                    one_minus_release * target_gain_reduction
+                    + release_coeff * current_gain
+                )
+            out[ch, i_sample] += audio[ch, i_sample] * current_gain * makeup_gain
+        gain_state[ch] = current_gain
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _limiter_kernel(audio, attack_coeff, release_coeff, ceiling, gain_state, out):
+    """
+    Per-sample brickwall limiter with the final ceiling clip fused into the loop.
+
+    Takes a (channels, N) buffer and limits each channel independently in parallel,
+    continuing from and updating the per-channel gain in gain_state. Results go to
+    out, which may be audio itself.
+    """
+    one_minus_attack = 1.0 - attack_coeff
+    one_minus_release = 1.0 - release_coeff
+
+    for ch in prange(audio.shape[0]):
+        current_gain = gain_state[ch]
+        for i_sample in range(audio.shape[1]):
+            sample = audio[ch, i_sample]
+            instant_level = abs(sample)
+            target_gain_reduction = 1.0
+            # Check if the signal *would* exceed ceiling with current gain
+            if instant_level * current_gain > ceiling:
+                target_gain_reduction = ceiling / instant_level
+
+            if target_gain_reduction < current_gain:
+                current_gain = (
+                    one_minus_attack * target_gain_reduction
+                    + attack_coeff * current_gain
+                )
+            else:
+                current_gain = (
+                    one_minus_release * target_gain_reduction
+                    + release_coeff * current_gain
+                )
+
+            limited = sample * current_gain
+            if limited > ceiling:
+                limited = ceiling
+            elif limited < -ceiling:
+                limited = -ceiling
+            out[ch, i_sample] = limited
+        gain_state[ch] = current_gain
+
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _saturation_kernel(audio, drive, amount):
+    """
+    In-place tape saturation blend: x + amount * (tanh(drive * x) - x).
+
+    tanh(y) is approximated by y * (27 + y^2) / (27 + 9 * y^2), which reaches
+    exactly +/-1 at |y| = 3 and is clamped beyond (max error ~0.024).
+    """
+    for ch in prange(audio.shape[0]):
+        for i_sample in range(audio.shape[1]):
+            x = audio[ch, i_sample]
+            y = x * drive
+            if y > 3.0:
+                saturated = 1.0
+            elif y < -3.0:
+                saturated = -1.0
+            else:
+                y2 = y * y
+                saturated = y * (27.0 + y2) / (27.0 + 9.0 * y2)
+            audio[ch, i_sample] = x + amount * (saturated - x)
+
+
+# Fixed filter settings of the mastering chain
+EQ_STAGES = (
+    {"type": "highshelf", "cutoff_freq": 8000, "q_val": 0.707, "gain_db": 1.0},
+    {"type": "peaking", "center_freq": 3000, "q_val": 1.5, "gain_db": 0.7},
+    {"type": "peaking", "center_freq": 7000, "q_val": 3.0, "gain_db": -0.5},
+    {"type": "peaking", "center_freq": 250, "q_val": 1.8, "gain_db": -0.8},
+    {"type": "lowshelf", "cutoff_freq": 100, "q_val": 0.707, "gain_db": 1.2},
+)
+LOW_CROSSOVER_HZ = 150
+MID_CROSSOVER_HZ = 2000
+CROSSOVER_ORDER = 4  # Linkwitz-Riley: a Butterworth of half this order, run twice
+MONO_BASS_CUTOFF_HZ = 120
+MONO_BASS_ORDER = 2
+
+# Multiband compressor settings for the (low, mid, high) bands
+COMPRESSOR_BANDS = (
+    {
+        "threshold_db": -20,
+        "ratio": 2.5,
+        "attack_ms": 10,
+        "release_ms": 150,
+        "makeup_gain_db": 1.0,
+    },
+    {
+        "threshold_db": -18,
+        "ratio": 3.0,
+        "attack_ms": 5,
+        "release_ms": 100,
+        "makeup_gain_db": 0.5,
+    },
+    {
+        "threshold_db": -15,
+        "ratio": 2.0,
+        "attack_ms": 2,
+        "release_ms": 80,
+        "makeup_gain_db": 0.0,
+    },
+)
+SATURATION_AMOUNT = 0.03
+WIDENING_FACTOR = 1.10
+LIMITER_CEILING_DB = -0.3
+LIMITER_ATTACK_MS = 1.5
+LIMITER_RELEASE_MS = 75.0
+
+# Noise-shaping highpass (order, cutoff Hz) applied to the dither of each option
+DITHER_SHAPING = {"POW-r 1": None, "POW-r 2": (2, 2000), "POW-r 3": (4, 4000)}
+
+# Shared generator for export dither noise
+_dither_rng = np.random.default_rng()
+
+
+@functools.lru_cache(maxsize=128)
+def _design_biquad_cached(filter_type, freq, sr, q_val, gain_db):
+    omega0 = 2 * math.pi * freq / sr
+    cos_omega0 = math.cos(omega0)
+    sin_omega0 = math.sin(omega0)
+
+    alpha = (
+        sin_omega0 / (2 * q_val) if q_val > 0 else sin_omega0
+    )  # Avoid division by zero for q_val
+
+    if filter_type == "peaking":
+        A_linear = 10 ** (gain_db / 20.0)
+        b = [1 + alpha * A_linear, -2 * cos_omega0, 1 - alpha * A_linear]
+        a = [1 + alpha / A_linear, -2 * cos_omega0, 1 - alpha / A_linear]
+    elif filter_type == "notch":
+        b = [1.0, -2 * cos_omega0, 1.0]
+        a = [1 + alpha, -2 * cos_omega0, 1 - alpha]
+    elif filter_type in ("highshelf", "lowshelf"):
+        # RBJ Cookbook shelving equations. A cut is the exact inverse of a boost
+        # by the same amount, so design the boost for |gain_db| and swap b and a.
+        A_shelf = 10 ** (abs(gain_db) / 40.0)
+        Ap1 = A_shelf + 1
+        Am1 = A_shelf - 1
+        Ap1c = Ap1 * cos_omega0
+        Am1c = Am1 * cos_omega0
+        two_sqrtA_alpha = 2 * math.sqrt(A_shelf) * alpha
+
+        if filter_type == "highshelf":
+            b = [
+                A_shelf * (Ap1 + Am1c + two_sqrtA_alpha),
+                -2 * A_shelf * (Am1 + Ap1c),
+                A_shelf * (Ap1 + Am1c - two_sqrtA_alpha),
+            ]
+            a = [
+                Ap1 - Am1c + two_sqrtA_alpha,
+                2 * (Am1 - Ap1c),
+                Ap1 - Am1c - two_sqrtA_alpha,
+            ]
+        else:
+            b = [
+                A_shelf * (Ap1 - Am1c + two_sqrtA_alpha),
+                2 * A_shelf * (Am1 - Ap1c),
+                A_shelf * (Ap1 - Am1c - two_sqrtA_alpha),
+            ]
+            a = [
+                Ap1 + Am1c + two_sqrtA_alpha,
+                -2 * (Am1 + Ap1c),
+                Ap1 + Am1c - two_sqrtA_alpha,
+            ]
+
+        if gain_db < 0:  # Cut
+            b, a = a, b
+    else:
+        raise ValueError(f"Unknown filter type: {filter_type}")
+
+    eps = np.finfo(float).eps
+    if abs(a[0]) < eps:
+        a[0] = math.copysign(eps, a[0]) if a[0] != 0 else eps
+
+    # One second-order section: [b0, b1, b2, 1, a1, a2]
+    return np.array(b + a) / a[0]
+
+
+def design_biquad(filter_type, freq, sr, q_val=1.0, gain_db=0.0):
+    """
+    Designs an RBJ-cookbook biquad as one normalised SOS row.
+
+    Coefficients are memoised on the parameters; a copy is returned so
+    callers cannot mutate the cached array.
+    """
+    return _design_biquad_cached(filter_type, freq, sr, q_val, gain_db).copy()
+
+
+@functools.lru_cache(maxsize=128)
+def _butter_sos_cached(order, cutoff, btype, fs):
+    return butter(order, cutoff, btype=btype, fs=fs, output="sos")
+
+
+def butter_sos(order, cutoff, btype, fs):
+    """
+    Designs a Butterworth filter as SOS, memoised on its parameters (returns a copy).
+    """
+    if isinstance(cutoff, list):
+        cutoff = tuple(cutoff)
+    return _butter_sos_cached(order, cutoff, btype, fs).copy()
+
+
+def _eq_sos(sr):
+    """
+    Stacks every EQ stage into one (n_stages, 6) SOS cascade.
+    """
+    return np.stack(
+        [
+            design_biquad(
+                stage["type"],
+                stage.get("center_freq", stage.get("cutoff_freq")),
+                sr,
+                stage["q_val"],
+                stage["gain_db"],
+            )
+            for stage in EQ_STAGES
+        ]
+    )
+
+
+def _crossover_sos(sr):
+    """
+    Returns the Linkwitz-Riley lowpass filters at the low and mid crossovers as SOS.
+
+    The multiband compressor derives all three bands from these two outputs.
+    The coefficients are float32 so sosfilt runs, and returns, in float32.
+    """
+    crossovers = []
+    for cutoff in (LOW_CROSSOVER_HZ, MID_CROSSOVER_HZ):
+        sos = butter_sos(CROSSOVER_ORDER // 2, cutoff, "low", sr).astype(np.float32)
+        crossovers.append(np.concatenate((sos, sos)))
+    return tuple(crossovers)
+
+
+def _envelope_coeff(time_ms, sr):
+    """
+    One-pole smoothing coefficient for an attack or release time.
+    """
+    return np.exp(-1.0 / (sr * (time_ms / 1000.0))) if time_ms > 0 else 0.0
+
+
+def _peak_abs(audio):
+    """
+    Peak absolute sample value of a buffer without an np.abs temporary.
+
+    max(x.max(), -x.min()) is two vectorised read-only passes, where
+    np.max(np.abs(x)) writes and re-reads a full-size copy of the audio.
+    """
+    if audio.size == 0:
+        return 0.0
+    return float(max(audio.max(), -audio.min()))
+
+
+def simple_compressor(
+    audio_segment,
+    sr_comp,
+    gain_state,
+    threshold_db=-18.0,
+    ratio=3.0,
+    attack_ms=5.0,
+    release_ms=100.0,
+    makeup_gain_db=0.0,
+    out=None,
+):
+    """
+    Compresses a (channels, N) band, continuing each channel's envelope from gain_state.
+
+    When out is given the compressed band is added to it rather than returned
+    in a new array, which lets the multiband compressor sum its bands in place.
+    """
+    if out is None:
+        out = np.zeros_like(audio_segment)
+    _compressor_kernel(
+        audio_segment,
+        _envelope_coeff(attack_ms, sr_comp),
+        _envelope_coeff(release_ms, sr_comp),
+        10 ** (threshold_db / 20.0),
+        10 ** (makeup_gain_db / 20.0),
+        1.0 / ratio,
+        gain_state,
+        out,
+    )
+    return out
+
+
+def brickwall_limiter(
+    audio_segment,
+    sr_lim,
+    ceiling_val,
+    gain_state,
+    attack_ms=1.0,
+    release_ms=50.0,
+    out=None,
+):
+    """
+    Limits a (channels, N) buffer to ceiling_val, continuing each channel's gain from gain_state.
+
+    Writes to out when given (pass audio_segment to limit in place).
+    """
+    if out is None:
+        out = np.empty_like(audio_segment)
+    return _limiter_kernel(
+        audio_segment,
+        _envelope_coeff(attack_ms, sr_lim),
+        _envelope_coeff(release_ms, sr_lim),
+        ceiling_val,
+        gain_state,
+        out,
+    )
+
+
+def _mono_bass_highpass_sos(sr):
+    """
+    Returns the highpass that keeps stereo width above the mono bass cutoff, in float32.
+    """
+    sos = butter_sos(MONO_BASS_ORDER, MONO_BASS_CUTOFF_HZ, "high", sr)
+    return sos.astype(np.float32)
+
+
+def require_audio(method):
+    """
+    Guards a pipeline stage that needs the main track to be loaded.
+
+    Raises:
+        RuntimeError: If the decorated stage is called before main audio is loaded.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.audio is None:
+            raise RuntimeError(f"Main audio not loaded. Cannot run {method.__name__}.")
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class MasteringPipeline:
-    def __init__(self, output_path="mastered_track.wav"):
+    def __init__(
+        self, output_path="mastered_track.wav", sample_rate=None, verbose=False
+    ):
         """
         Initializes the MasteringPipeline.
 
         Args:
             output_path (str): The desired filename for the mastered audio file
                                within the environment. Defaults to "mastered_track.wav".
+            sample_rate (int, optional): Expected sample rate of the input. When given,
+                               the fixed filters are designed and the Numba kernels
+                               compiled up front.
+            verbose (bool): Print each note as it is logged. Otherwise notes are only
+                               written out in the summary at the end of a pipeline run.
         """
         self.output_path = output_path
         self.reference_audio = None
         self.reference_sr = None
         self.audio = None
         self.sr = None
+        # True while self.audio is a read-only (2, N) broadcast of a mono track
+        self._dual_mono_view = False
         self.notes = []  # To store notes on processing steps
+        self.verbose = verbose
+        if sample_rate is not None:
+            self._warm_up(sample_rate)
+
+    def _warm_up(self, sr):
+        """
+        Specialises the pipeline for a sample rate ahead of processing.
+
+        Runs every processing stage on a tiny silent block, which designs and caches
+        all fixed filters for this rate and compiles each Numba kernel for the dtypes
+        the pipeline feeds it, so the first real track pays neither cost.
+
+        Args:
+            sr (int): The sample rate to prepare for.
+        """
+        previous_sr, self.sr = self.sr, sr
+        try:
+            block = np.zeros((2, 16), dtype=np.float32)
+            block, _ = self._eq_chunk(block, None)
+            block, _ = self._compression_chunk(block, None)
+            block, _ = self._enhancement_chunk(block, None)
+            self._limiting_chunk(block, None)
+        finally:
+            self.sr = previous_sr
 
     def _log_note(self, step, description):
         """
@@ -37,7 +470,17 @@ class MasteringPipeline:
             description (str): A description of the action taken.
         """
         self.notes.append(f"Step {step}: {description}")
-        print(f"Step {step}: {description}")
+        if self.verbose:
+            print(f"Step {step}: {description}")
+
+    def _write_notes_summary(self):
+        """
+        Writes every logged note to stdout in a single write.
+        """
+        sys.stdout.write(
+            "Summary of actions taken:\n"
+            + "".join(f"- {note}\n" for note in self.notes)
+        )
 
     def load_audio_from_bytes(self, audio_bytes, sample_rate=None, is_reference=False):
         """
@@ -53,82 +496,146 @@ class MasteringPipeline:
             audio_data, sr_orig = sf.read(
                 io.BytesIO(audio_bytes), dtype="float32", always_2d=True
             )
-            # soundfile's always_2d=True returns (N_frames, N_channels)
-            # We want (N_channels, N_frames)
-            audio_data = audio_data.T
+            self._store_loaded_audio(audio_data, sr_orig, is_reference)
+        except Exception as e:
+            raise RuntimeError(
+                f"Error loading audio from bytes: {e}. Ensure it's a valid audio format (e.g., WAV, FLAC)."
+            )
+
+    def load_audio_from_path(self, path, is_reference=False):
+        """
+        Loads audio straight from a file on disk.
+        libsndfile decodes the file directly into the output array, so the raw file
+        bytes are never held in memory alongside the decoded samples.
+
+        Args:
+            path (str): Path to the audio file.
+            is_reference (bool): True if this is the reference track, False for the main track.
+        """
+        try:
+            audio_data, sr_orig = sf.read(path, dtype="float32", always_2d=True)
+            self._store_loaded_audio(audio_data, sr_orig, is_reference)
+        except Exception as e:
+            raise RuntimeError(
+                f"Error loading audio from '{path}': {e}. Ensure it's a valid audio format (e.g., WAV, FLAC)."
+            )
+
+    def _load_audio(self, source, is_reference=False):
+        """
+        Loads audio from a file path or from the byte content of a file.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            self.load_audio_from_path(source, is_reference=is_reference)
+        else:
+            self.load_audio_from_bytes(source, is_reference=is_reference)
+
+    def _store_loaded_audio(self, audio_data, sr_orig, is_reference):
+        """
+        Stores decoded (N_frames, N_channels) audio as the main or reference track.
+        Ensures audio is stereo (2 channels, N samples). Mono files are converted to dual mono.
+        """
+        # soundfile's always_2d=True returns (N_frames, N_channels)
+        # We want (N_channels, N_frames), C-contiguous so each channel row is
+        # a contiguous float32 buffer for the filters and kernels downstream
+        audio_data = np.ascontiguousarray(audio_data.T, dtype=np.float32)
+
+        current_sr = sr_orig  # Using original sample rate
+
+        if is_reference:
+            self.reference_audio = audio_data
+            self.reference_sr = current_sr
+            self._log_note(
+                "Load Ref",
+                f"Reference audio loaded successfully: {current_sr} Hz, {audio_data.shape[0]} channels, {audio_data.shape[1]} samples.",
+            )
+        else:
+            self.audio = audio_data
+            self.sr = current_sr
+            self._log_note(
+                "Load Main",
+                f"Main audio loaded successfully: {current_sr} Hz, {audio_data.shape[0]} channels, {audio_data.shape[1]} samples.",
+            )
 
-            current_sr = sr_orig  # Using original sample rate
+        if not is_reference:
+            self._dual_mono_view = False
 
+        # Ensure audio is stereo for processes like stereo widening
+        # If mono, convert to dual mono. Both channels stay identical until the
+        # enhancement stage, so this is a zero-copy broadcast view for now
+        target_audio_array = self.reference_audio if is_reference else self.audio
+        if target_audio_array is not None and target_audio_array.shape[0] == 1:
+            self._log_note(
+                "Mono Conversion",
+                "Input audio is mono. Converting to dual mono for stereo processing.",
+            )
+            target_audio_array = np.broadcast_to(
+                target_audio_array, (2, target_audio_array.shape[1])
+            )
             if is_reference:
-                self.reference_audio = audio_data
-                self.reference_sr = current_sr
-                self._log_note(
-                    "Load Ref",
-                    f"Reference audio loaded successfully: {current_sr} Hz, {audio_data.shape[0]} channels, {audio_data.shape[1]} samples.",
-                )
+                self.reference_audio = target_audio_array
             else:
-                self.audio = audio_data
-                self.sr = current_sr
-                self._log_note(
-                    "Load Main",
-                    f"Main audio loaded successfully: {current_sr} Hz, {audio_data.shape[0]} channels, {audio_data.shape[1]} samples.",
-                )
+                self.audio = target_audio_array
+                self._dual_mono_view = True
+            self._log_note(
+                "Mono Conversion",
+                f"Audio now has {target_audio_array.shape[0]} channels.",
+            )
 
-            # Ensure audio is stereo for processes like stereo widening
-            # If mono, convert to dual mono
-            target_audio_array = self.reference_audio if is_reference else self.audio
-            if target_audio_array is not None and target_audio_array.shape[0] == 1:
-                self._log_note(
-                    "Mono Conversion",
-                    "Input audio is mono. Converting to dual mono for stereo processing.",
-                )
-                target_audio_array = np.concatenate(
-                    (target_audio_array, target_audio_array), axis=0
-                )
-                if is_reference:
-                    self.reference_audio = target_audio_array
-                else:
-                    self.audio = target_audio_array
-                self._log_note(
-                    "Mono Conversion",
-                    f"Audio now has {target_audio_array.shape[0]} channels.",
-                )
+        if (
+            self.audio is not None and self.audio.shape[0] != 2 and not is_reference
+        ):  # Check main audio
+            self._log_note(
+                "Warning",
+                f"Loaded main audio has {self.audio.shape[0]} channels after processing. Pipeline expects stereo. Problems may occur.",
+            )
+        if (
+            self.reference_audio is not None
+            and self.reference_audio.shape[0] != 2
+            and is_reference
+        ):  # Check ref audio
+            self._log_note(
+                "Warning",
+                f"Loaded reference audio has {self.reference_audio.shape[0]} channels after processing. Pipeline expects stereo.",
+            )
 
-            if (
-                self.audio is not None and self.audio.shape[0] != 2 and not is_reference
-            ):  # Check main audio
-                self._log_note(
-                    "Warning",
-                    f"Loaded main audio has {self.audio.shape[0]} channels after processing. Pipeline expects stereo. Problems may occur.",
-                )
-            if (
-                self.reference_audio is not None
-                and self.reference_audio.shape[0] != 2
-                and is_reference
-            ):  # Check ref audio
-                self._log_note(
-                    "Warning",
-                    f"Loaded reference audio has {self.reference_audio.shape[0]} channels after processing. Pipeline expects stereo.",
-                )
+    def _distinct_channels(self):
+        """
+        Returns the channels of the main track that need processing.
 
-        except Exception as e:
-            raise RuntimeError(
-                f"Error loading audio from bytes: {e}. Ensure it's a valid audio format (e.g., WAV, FLAC)."
-            )
+        While the track is a dual-mono view this is its single underlying channel,
+        so channel-independent stages filter the samples once instead of twice.
+        """
+        return self.audio[:1] if self._dual_mono_view else self.audio
+
+    def _store_processed(self, processed):
+        """
+        Stores the output of a stage that ran on _distinct_channels().
+        """
+        if self._dual_mono_view:
+            processed = np.broadcast_to(processed, (2, processed.shape[1]))
+        self.audio = processed
+
+    def _materialize_dual_mono(self):
+        """
+        Turns a dual-mono view into a real, writable (2, N) buffer.
 
+        Needed before any stage that treats left and right differently or writes
+        to self.audio in place.
+        """
+        if self._dual_mono_view:
+            self.audio = np.ascontiguousarray(self.audio)
+            self._dual_mono_view = False
+
+    @require_audio
     def prepare_track(self):
         """
         Simulates the track preparation phase.
         Checks initial peak level and logs reference track presence.
         """
-        if self.audio is None:
-            self._log_note("Error", "Main audio not loaded. Cannot prepare track.")
-            return
-
         self._log_note(
             "1", "Preparing track: Ensuring proper headroom and referencing."
         )
-        peak_level = np.max(np.abs(self.audio)) if self.audio.size > 0 else 0
+        peak_level = _peak_abs(self.audio)
         peak_level_db = 20 * np.log10(peak_level) if peak_level > 0 else -np.inf
         self._log_note("1", f"Initial peak level: {peak_level_db:.2f} dBFS.")
         if peak_level_db > -3.0:
@@ -145,15 +652,12 @@ class MasteringPipeline:
         else:
             self._log_note("1", "No reference track provided for detailed comparison.")
 
+    @require_audio
     def listen_and_note(self):
         """
         Simulates the critical listening and note-taking phase.
         This step requires manual user interaction in a real workflow.
         """
-        if self.audio is None:
-            self._log_note("Error", "Main audio not loaded. Cannot listen and note.")
-            return
-
         self._log_note(
             "2", "Listening to the track for potential issues and noting the approach."
         )
@@ -166,261 +670,107 @@ Make notes on desired EQ adjustments, compression needs, etc. This pipeline will
         )
         # Removed Colab/interactive input prompt as it's not suitable for a module
 
+    @require_audio
     def apply_master_eq(self):
         """
         Applies a multi-band parametric EQ to the master track using IIR biquad filters.
         """
-        if self.audio is None:
-            self._log_note("Error", "Main audio not loaded. Cannot apply EQ.")
-            return
+        audio = self._distinct_channels()
+        assert audio.flags["C_CONTIGUOUS"]
         self._log_note("3", "Applying master EQ.")
 
-        def design_biquad(filter_type, freq, sr, q_val=1.0, gain_db=0.0):
-            omega0 = 2 * np.pi * freq / sr
-            cos_omega0 = np.cos(omega0)
-            sin_omega0 = np.sin(omega0)
-            A_shelf = 10 ** (gain_db / 40.0)  # For shelving filters
-            A_linear = 10 ** (gain_db / 20.0)  # For peaking filters
-
-            alpha = (
-                sin_omega0 / (2 * q_val) if q_val > 0 else sin_omega0
-            )  # Avoid division by zero for q_val
-
-            b = np.zeros(3)
-            a = np.zeros(3)
-
-            if filter_type == "peaking":
-                b[0] = 1 + alpha * A_linear
-                b[1] = -2 * cos_omega0
-                b[2] = 1 - alpha * A_linear
-                a[0] = (
-                    1 + alpha / A_linear if A_linear != 0 else 1 + alpha
-                )  # Avoid division by zero
-                a[1] = -2 * cos_omega0
-                a[2] = (
-                    1 - alpha / A_linear if A_linear != 0 else 1 - alpha
-                )  # Avoid division by zero
-            elif filter_type == "notch":
-                b[0] = 1
-                b[1] = -2 * cos_omega0
-                b[2] = 1
-                a[0] = 1 + alpha
-                a[1] = -2 * cos_omega0
-                a[2] = 1 - alpha
-            elif filter_type == "highshelf":
-                # RBJ Cookbook equations for High-Shelf
-                if gain_db >= 0:  # Boost
-                    b[0] = A_shelf * (
-                        (A_shelf + 1)
-                        + (A_shelf - 1) * cos_omega0
-                        + 2 * np.sqrt(A_shelf) * alpha
-                    )
-                    b[1] = -2 * A_shelf * ((A_shelf - 1) + (A_shelf + 1) * cos_omega0)
-                    b[2] = A_shelf * (
-                        (A_shelf + 1)
-                        + (A_shelf - 1) * cos_omega0
-                        - 2 * np.sqrt(A_shelf) * alpha
-                    )
-                    a[0] = (
-                        (A_shelf + 1)
-                        - (A_shelf - 1) * cos_omega0
-                        + 2 * np.sqrt(A_shelf) * alpha
-                    )
-                    a[1] = 2 * ((A_shelf - 1) - (A_shelf + 1) * cos_omega0)
-                    a[2] = (
-                        (A_shelf + 1)
-                        - (A_shelf - 1) * cos_omega0
-                        - 2 * np.sqrt(A_shelf) * alpha
-                    )
-                else:  # Cut
-                    A_shelf_inv = (
-                        1 / A_shelf if A_shelf != 0 else np.finfo(float).eps
-                    )  # Avoid division by zero
-                    # Calculate coefficients for boost with A_shelf_inv
-                    b0_calc = A_shelf_inv * (
-                        (A_shelf_inv + 1)
-                        + (A_shelf_inv - 1) * cos_omega0
-                        + 2 * np.sqrt(A_shelf_inv) * alpha
-                    )
-                    b1_calc = (
-                        -2
-                        * A_shelf_inv
-                        * ((A_shelf_inv - 1) + (A_shelf_inv + 1) * cos_omega0)
-                    )
-                    b2_calc = A_shelf_inv * (
-                        (A_shelf_inv + 1)
-                        + (A_shelf_inv - 1) * cos_omega0
-                        - 2 * np.sqrt(A_shelf_inv) * alpha
-                    )
-                    a0_calc = (
-                        (A_shelf_inv + 1)
-                        - (A_shelf_inv - 1) * cos_omega0
-                        + 2 * np.sqrt(A_shelf_inv) * alpha
-                    )
-                    a1_calc = 2 * ((A_shelf_inv - 1) - (A_shelf_inv + 1) * cos_omega0)
-                    a2_calc = (
-                        (A_shelf_inv + 1)
-                        - (A_shelf_inv - 1) * cos_omega0
-                        - 2 * np.sqrt(A_shelf_inv) * alpha
-                    )
-                    # Swap b and a for cut
-                    b = np.array([a0_calc, a1_calc, a2_calc])
-                    a = np.array([b0_calc, b1_calc, b2_calc])
-            else:
-                raise ValueError(f"Unknown filter type: {filter_type}")
-
-            if np.abs(a[0]) < np.finfo(float).eps:
-                a[0] = (
-                    np.copysign(np.finfo(float).eps, a[0])
-                    if a[0] != 0
-                    else np.finfo(float).eps
-                )
-
-            return b / a[0], a / a[0]
-
-        eq_stages = [
-            {"type": "highshelf", "cutoff_freq": 8000, "q_val": 0.707, "gain_db": 1.0},
-            {"type": "peaking", "center_freq": 3000, "q_val": 1.5, "gain_db": 0.7},
-            {"type": "peaking", "center_freq": 7000, "q_val": 3.0, "gain_db": -0.5},
-            {"type": "peaking", "center_freq": 250, "q_val": 1.8, "gain_db": -0.8},
-            {"type": "lowshelf", "cutoff_freq": 100, "q_val": 0.707, "gain_db": 1.2},
-        ]
+        # Stays an IIR cascade: on a 1M-sample stereo buffer, sosfilt beats FFT
+        # convolution with the chain's impulse response up to about 8 sections,
+        # and the chain has 5
+        audio, _ = self._eq_chunk(audio, None)
+        self._store_processed(audio)
+        self._log_note("3", "Master EQ applied with multiple filter stages.")
 
-        processed_audio = np.copy(self.audio)
-        for stage in eq_stages:
-            freq_param = stage.get("center_freq", stage.get("cutoff_freq"))
-            b_coeffs, a_coeffs = design_biquad(
-                stage["type"], freq_param, self.sr, stage["q_val"], stage["gain_db"]
-            )
-            for i in range(self.audio.shape[0]):
-                processed_audio[i] = lfilter(b_coeffs, a_coeffs, processed_audio[i])
+    def _eq_chunk(self, chunk, state):
+        """
+        Runs the IIR EQ cascade over one (channels, n) block.
 
-        self.audio = processed_audio
-        self._log_note("3", "Master EQ applied with multiple filter stages.")
+        Args:
+            chunk (np.ndarray): The block to filter.
+            state (np.ndarray or None): Filter memory from the previous block, or None
+                                        to start from rest.
 
+        Returns:
+            tuple: The filtered float32 block and the filter memory for the next block.
+        """
+        sos = _eq_sos(self.sr)
+        if state is None:
+            state = np.zeros((sos.shape[0], chunk.shape[0], 2))
+        # All stages cascaded as one SOS matrix, filtering every channel in one call.
+        # Unlike the crossovers this stays in float64: the shelves sit close to the
+        # unit circle, and a float32 cascade was both less accurate and slower here
+        out, state = sosfilt(sos, chunk, axis=-1, zi=state)
+        return out.astype(np.float32, copy=False), state
+
+    @require_audio
     def apply_master_compression(self):
         """
         Applies a simulated multiband compression.
         """
-        if self.audio is None:
-            self._log_note("Error", "Main audio not loaded. Cannot apply compression.")
-            return
+        audio = self._distinct_channels()
+        assert audio.flags["C_CONTIGUOUS"]
         self._log_note("4", "Applying master multiband compression.")
 
-        def simple_compressor(
-            audio_segment,
-            sr_comp,
-            threshold_db=-18.0,
-            ratio=3.0,
-            attack_ms=5.0,
-            release_ms=100.0,
-            makeup_gain_db=0.0,
-        ):
-            threshold = 10 ** (threshold_db / 20.0)
-            attack_coeff = (
-                np.exp(-1.0 / (sr_comp * (attack_ms / 1000.0)))
-                if attack_ms > 0
-                else 0.0
-            )
-            release_coeff = (
-                np.exp(-1.0 / (sr_comp * (release_ms / 1000.0)))
-                if release_ms > 0
-                else 0.0
-            )
-            makeup_gain = 10 ** (makeup_gain_db / 20.0)
-
-            gain_envelope = np.ones_like(audio_segment)
-            current_gain = 1.0
-
-            for i_sample in range(len(audio_segment)):
-                instant_level = np.abs(audio_segment[i_sample])
-                target_gain_reduction = 1.0
-                if (
-                    instant_level > threshold and threshold > 0
-                ):  # Add check for threshold > 0 to avoid issues with log
-                    target_gain_reduction = (
-                        (threshold + (instant_level - threshold) / ratio)
-                        / instant_level
-                        if instant_level > 0
-                        else 1.0
-                    )
-
-                if target_gain_reduction < current_gain:
-                    current_gain = (
-                        1.0 - attack_coeff
-                    ) * target_gain_reduction + attack_coeff * current_gain
-                else:
-                    current_gain = (
-                        1.0 - release_coeff
-                    ) * target_gain_reduction + release_coeff * current_gain
-                gain_envelope[i_sample] = current_gain
-
-            return audio_segment * gain_envelope * makeup_gain
-
-        low_crossover = 150
-        mid_crossover = 2000
-        filter_order = 4
+        audio, _ = self._compression_chunk(audio, None)
+        self._store_processed(audio)
+        self._log_note(
+            "4", "Simulated multiband compression applied (Low, Mid, High bands)."
+        )
 
-        processed_channels = []
-        for i in range(self.audio.shape[0]):
-            channel_audio = self.audio[i]
+    def _compression_chunk(self, chunk, state):
+        """
+        Runs the multiband compressor over one (channels, n) block.
 
-            b_low, a_low = butter(filter_order, low_crossover, btype="low", fs=self.sr)
-            low_band = lfilter(b_low, a_low, channel_audio)
+        Args:
+            chunk (np.ndarray): The block to compress.
+            state (tuple or None): Crossover filter memories and compressor gains per
+                                   band from the previous block, or None to start fresh.
 
-            b_mid, a_mid = butter(
-                filter_order, [low_crossover, mid_crossover], btype="band", fs=self.sr
+        Returns:
+            tuple: The compressed block and the state for the next block.
+        """
+        crossovers = _crossover_sos(self.sr)
+        if state is None:
+            state = (
+                [
+                    np.zeros((sos.shape[0], chunk.shape[0], 2), dtype=np.float32)
+                    for sos in crossovers
+                ],
+                [np.ones(chunk.shape[0]) for _ in COMPRESSOR_BANDS],
             )
-            mid_band = lfilter(b_mid, a_mid, channel_audio)
+        filter_states, gain_states = state
 
-            b_high, a_high = butter(
-                filter_order, mid_crossover, btype="high", fs=self.sr
-            )
-            high_band = lfilter(b_high, a_high, channel_audio)
+        # Two lowpass passes split every channel into three bands that sum back
+        # to the input exactly: low, (below mid crossover - low) and the rest
+        low, filter_states[0] = sosfilt(
+            crossovers[0], chunk, axis=-1, zi=filter_states[0]
+        )
+        mid, filter_states[1] = sosfilt(
+            crossovers[1], chunk, axis=-1, zi=filter_states[1]
+        )
+        high = chunk - mid
+        mid -= low
 
-            compressed_low = simple_compressor(
-                low_band,
-                self.sr,
-                threshold_db=-20,
-                ratio=2.5,
-                attack_ms=10,
-                release_ms=150,
-                makeup_gain_db=1.0,
-            )
-            compressed_mid = simple_compressor(
-                mid_band,
-                self.sr,
-                threshold_db=-18,
-                ratio=3.0,
-                attack_ms=5,
-                release_ms=100,
-                makeup_gain_db=0.5,
-            )
-            compressed_high = simple_compressor(
-                high_band,
-                self.sr,
-                threshold_db=-15,
-                ratio=2.0,
-                attack_ms=2,
-                release_ms=80,
-                makeup_gain_db=0.0,
+        out = np.zeros_like(chunk)
+        for band_index, (band, settings) in enumerate(
+            zip((low, mid, high), COMPRESSOR_BANDS)
+        ):
+            simple_compressor(
+                band, self.sr, gain_states[band_index], out=out, **settings
             )
+        return out, state
 
-            recombined_channel = compressed_low + compressed_mid + compressed_high
-            processed_channels.append(recombined_channel)
-
-        self.audio = np.array(processed_channels)
-        self._log_note(
-            "4", "Simulated multiband compression applied (Low, Mid, High bands)."
-        )
-
+    @require_audio
     def apply_enhancement(self):
         """
         Applies subtle tape saturation and stereo widening.
         """
-        if self.audio is None:
-            self._log_note("Error", "Main audio not loaded. Cannot apply enhancement.")
-            return
+        self._materialize_dual_mono()
         if self.audio.shape[0] != 2:
             self._log_note(
                 "5",
@@ -428,167 +778,136 @@ Make notes on desired EQ adjustments, compression needs, etc. This pipeline will
             )
             return
 
+        assert self.audio.flags["C_CONTIGUOUS"]
         self._log_note(
             "5", "Applying optional enhancement: Saturation and Stereo Widening."
         )
 
-        saturation_amount = 0.03
-        drive = 1.0 + saturation_amount * 3.0
-
-        saturated_part = np.tanh(self.audio * drive)
-        self.audio = (
-            1 - saturation_amount
-        ) * self.audio + saturation_amount * saturated_part
+        self.audio, _ = self._enhancement_chunk(self.audio, None)
         self._log_note(
             "5",
-            f"Subtle tape saturation applied (amount: {saturation_amount*100:.1f}%).",
+            f"Subtle tape saturation applied (amount: {SATURATION_AMOUNT*100:.1f}%).",
+        )
+        self._log_note(
+            "5",
+            f"Stereo widening applied (factor: {WIDENING_FACTOR:.2f}) with mono bass preservation below {MONO_BASS_CUTOFF_HZ}Hz.",
         )
 
-        mid = 0.5 * (self.audio[0] + self.audio[1])
-        side = 0.5 * (self.audio[0] - self.audio[1])
-
-        widening_factor = 1.10
-        side_widened = side * widening_factor
-
-        left_out = mid + side_widened
-        right_out = mid - side_widened
+    def _enhancement_chunk(self, chunk, state):
+        """
+        Applies saturation and stereo widening to one (2, n) block in place.
 
-        mono_bass_cutoff_freq = 120
-        filter_order_bass = 2
+        Args:
+            chunk (np.ndarray): The stereo block to enhance.
+            state (np.ndarray or None): Side highpass memory from the previous block, or
+                                        None to start from rest.
 
-        b_lp_mono, a_lp_mono = butter(
-            filter_order_bass, mono_bass_cutoff_freq, btype="low", fs=self.sr
+        Returns:
+            tuple: The enhanced block and the filter memory for the next block.
+        """
+        sos_hp = _mono_bass_highpass_sos(self.sr)
+        if state is None:
+            state = np.zeros((sos_hp.shape[0], 2), dtype=np.float32)
+
+        # The rational tanh approximation's error is scaled by the blend amount,
+        # so it stays inaudible only for subtle saturation
+        assert SATURATION_AMOUNT < 0.1
+        drive = 1.0 + SATURATION_AMOUNT * 3.0
+        _saturation_kernel(chunk, drive, SATURATION_AMOUNT)
+
+        # Encode to [mid, widened side] with one (2, 2) @ (2, N) matmul
+        ms_encode = np.array(
+            [[0.5, 0.5], [0.5 * WIDENING_FACTOR, -0.5 * WIDENING_FACTOR]],
+            dtype=chunk.dtype,
         )
-        mono_bass_component = lfilter(b_lp_mono, a_lp_mono, mid)
+        mid_side = ms_encode @ chunk
 
-        b_hp_stereo, a_hp_stereo = butter(
-            filter_order_bass, mono_bass_cutoff_freq, btype="high", fs=self.sr
-        )
-        left_hp = lfilter(b_hp_stereo, a_hp_stereo, left_out)
-        right_hp = lfilter(b_hp_stereo, a_hp_stereo, right_out)
+        # Mono bass is the complement of the stereo highpass (mid - HP(mid)), so
+        # HP(mid +/- side) + mid - HP(mid) reduces to mid +/- HP(side): only the
+        # side signal needs filtering.
+        mid_side[1], state = sosfilt(sos_hp, mid_side[1], zi=state)
 
-        self.audio[0] = left_hp + mono_bass_component
-        self.audio[1] = right_hp + mono_bass_component
-        self._log_note(
-            "5",
-            f"Stereo widening applied (factor: {widening_factor:.2f}) with mono bass preservation below {mono_bass_cutoff_freq}Hz.",
-        )
+        # Decode back to L/R (mid +/- side) straight into the block
+        ms_decode = np.array([[1.0, 1.0], [1.0, -1.0]], dtype=chunk.dtype)
+        np.matmul(ms_decode, mid_side, out=chunk)
+        return chunk, state
 
+    @require_audio
     def apply_limiting(self):
         """
         Applies a brickwall limiter.
         """
-        if self.audio is None:
-            self._log_note("Error", "Main audio not loaded. Cannot apply limiting.")
-            return
+        self._materialize_dual_mono()
+        assert self.audio.flags["C_CONTIGUOUS"]
         self._log_note("6", "Applying brickwall limiting for loudness.")
-
-        ceiling_db = -0.3
-        ceiling_linear = 10 ** (ceiling_db / 20.0)
-
-        def brickwall_limiter(
-            audio_segment, sr_lim, ceiling_val, attack_ms=1.0, release_ms=50.0
-        ):
-            attack_coeff = (
-                np.exp(-1.0 / (sr_lim * (attack_ms / 1000.0))) if attack_ms > 0 else 0.0
-            )
-            release_coeff = (
-                np.exp(-1.0 / (sr_lim * (release_ms / 1000.0)))
-                if release_ms > 0
-                else 0.0
-            )
-
-            gain_envelope = np.ones_like(audio_segment)
-            current_gain = 1.0
-
-            for i_sample in range(len(audio_segment)):
-                instant_level = np.abs(audio_segment[i_sample])
-                target_gain_reduction = 1.0
-                # Check if the signal *would* exceed ceiling with current gain
-                if instant_level * current_gain > ceiling_val:
-                    target_gain_reduction = (
-                        ceiling_val / instant_level if instant_level > 0 else 1.0
-                    )
-
-                if target_gain_reduction < current_gain:
-                    current_gain = (
-                        1.0 - attack_coeff
-                    ) * target_gain_reduction + attack_coeff * current_gain
-                else:
-                    current_gain = (
-                        1.0 - release_coeff
-                    ) * target_gain_reduction + release_coeff * current_gain
-                gain_envelope[i_sample] = current_gain
-
-            limited_audio = audio_segment * gain_envelope
-            return np.clip(limited_audio, -ceiling_val, ceiling_val)
-
-        best_attack_ms = 1.5
-        best_release_ms = 75.0
         self._log_note(
             "6",
-            f"Limiter settings: Attack={best_attack_ms:.2f}ms, Release={best_release_ms:.2f}ms, Ceiling={ceiling_db:.2f}dBFS.",
+            f"Limiter settings: Attack={LIMITER_ATTACK_MS:.2f}ms, Release={LIMITER_RELEASE_MS:.2f}ms, Ceiling={LIMITER_CEILING_DB:.2f}dBFS.",
         )
 
-        processed_channels = []
-        for i in range(self.audio.shape[0]):
-            limited_channel = brickwall_limiter(
-                self.audio[i], self.sr, ceiling_linear, best_attack_ms, best_release_ms
-            )
-            processed_channels.append(limited_channel)
-        self.audio = np.array(processed_channels)
+        self.audio, _ = self._limiting_chunk(self.audio, None)
 
-        final_peak_val = np.max(np.abs(self.audio)) if self.audio.size > 0 else 0
+        final_peak_val = _peak_abs(self.audio)
         final_peak_db = 20 * np.log10(final_peak_val) if final_peak_val > 0 else -np.inf
         self._log_note(
             "6",
             f"Brickwall limiting applied. Final peak level: {final_peak_db:.2f} dBFS.",
         )
 
+    def _limiting_chunk(self, chunk, state):
+        """
+        Runs the brickwall limiter over one (channels, n) block.
+
+        Args:
+            chunk (np.ndarray): The block to limit.
+            state (np.ndarray or None): Per-channel limiter gain from the previous block,
+                                        or None to start at unity.
+
+        Returns:
+            tuple: The limited block and the limiter gains for the next block.
+        """
+        if state is None:
+            state = np.ones(chunk.shape[0])
+        # All channels are limited in one call, in parallel and in place
+        brickwall_limiter(
+            chunk,
+            self.sr,
+            10 ** (LIMITER_CEILING_DB / 20.0),
+            state,
+            LIMITER_ATTACK_MS,
+            LIMITER_RELEASE_MS,
+            out=chunk,
+        )
+        return chunk, state
+
+    @require_audio
     def export_track(self, bit_depth=24, dither_option="POW-r 2"):
         """
         Exports the mastered track with specified bit depth and conceptual dithering.
         """
-        if self.audio is None:
-            self._log_note("Error", "Main audio not processed. Cannot export.")
-            return
+        self._materialize_dual_mono()
         self._log_note(
             "7",
             f"Exporting track to {self.output_path} with {bit_depth}-bit and {dither_option} dither.",
         )
 
-        max_abs = np.max(np.abs(self.audio)) if self.audio.size > 0 else 0
+        max_abs = _peak_abs(self.audio)
         if max_abs > 1.0:  # Should not happen if limiter works, but safeguard
             self.audio /= max_abs
 
-        temp_audio_export = np.copy(self.audio)
+        # Dither builds a fresh export buffer, so self.audio itself is never copied
+        temp_audio_export = self.audio
 
         if bit_depth < 32:
-            quant_levels = 2**bit_depth
-            dither_noise_one_sample = (
-                np.random.uniform(-1.0, 1.0, temp_audio_export.shape)
-                + np.random.uniform(-1.0, 1.0, temp_audio_export.shape)
-            ) * (1.0 / quant_levels)
-
             if dither_option == "POW-r 1":
                 self._log_note(
                     "7", "Applying conceptual POW-r 1 dither (minimal noise shaping)."
                 )
             elif dither_option == "POW-r 2":
-                b_ns, a_ns = butter(2, 2000 / (self.sr / 2.0), btype="high")
-                for i in range(temp_audio_export.shape[0]):
-                    dither_noise_one_sample[i] = lfilter(
-                        b_ns, a_ns, dither_noise_one_sample[i]
-                    )
                 self._log_note(
                     "7", "Applying conceptual POW-r 2 dither (moderate noise shaping)."
                 )
             elif dither_option == "POW-r 3":
-                b_ns, a_ns = butter(4, 4000 / (self.sr / 2.0), btype="high")
-                for i in range(temp_audio_export.shape[0]):
-                    dither_noise_one_sample[i] = lfilter(
-                        b_ns, a_ns, dither_noise_one_sample[i]
-                    )
                 self._log_note(
                     "7",
                     "Applying conceptual POW-r 3 dither (aggressive noise shaping).",
@@ -599,7 +918,9 @@ Make notes on desired EQ adjustments, compression needs, etc. This pipeline will
                     f"Unknown dither option '{dither_option}'. Applying basic TPDF dither without shaping.",
                 )
 
-            temp_audio_export += dither_noise_one_sample
+            temp_audio_export, _ = self._dither_chunk(
+                self.audio, bit_depth, dither_option, None
+            )
 
         try:
             sf.write(
@@ -621,6 +942,45 @@ Make notes on desired EQ adjustments, compression needs, etc. This pipeline will
             self._log_note("Error", f"Error exporting audio file: {e}")
             raise RuntimeError(f"Error exporting audio file: {e}")
 
+    def _dither_chunk(self, chunk, bit_depth, dither_option, state):
+        """
+        Adds (optionally noise-shaped) TPDF dither to one (channels, n) block.
+
+        The dithered block is built in the noise buffer; chunk itself is left untouched.
+
+        Args:
+            chunk (np.ndarray): The block to dither.
+            bit_depth (int): Target bit depth.
+            dither_option (str): Dithering algorithm (see DITHER_SHAPING).
+            state (np.ndarray or None): Noise-shaping filter memory from the previous
+                                        block, or None to start from rest.
+
+        Returns:
+            tuple: The dithered block and the filter memory for the next block.
+        """
+        if bit_depth >= 32:
+            return chunk, state
+
+        quant_levels = 2**bit_depth
+        # TPDF: sum of two uniforms on [-1, 1), scaled to one quantisation step
+        dither_noise_one_sample = _dither_rng.random(chunk.shape, dtype=np.float32)
+        dither_noise_one_sample += _dither_rng.random(chunk.shape, dtype=np.float32)
+        dither_noise_one_sample -= 1.0
+        dither_noise_one_sample *= 2.0 / quant_levels
+
+        shaping = DITHER_SHAPING.get(dither_option)
+        if shaping is not None:
+            sos_ns = butter_sos(shaping[0], shaping[1], "high", self.sr)
+            sos_ns = sos_ns.astype(np.float32)
+            if state is None:
+                state = np.zeros((sos_ns.shape[0], chunk.shape[0], 2), dtype=np.float32)
+            dither_noise_one_sample, state = sosfilt(
+                sos_ns, dither_noise_one_sample, axis=-1, zi=state
+            )
+
+        np.add(dither_noise_one_sample, chunk, out=dither_noise_one_sample)
+        return dither_noise_one_sample, state
+
     def run_mastering_pipeline(
         self,
         main_audio_bytes,
@@ -630,17 +990,26 @@ Make notes on desired EQ adjustments, compression needs, etc. This pipeline will
     ):
         """
         Executes the entire mastering pipeline step-by-step.
+
+        Despite their names, main_audio_bytes and reference_audio_bytes also accept
+        a path to an audio file; paths are decoded straight from disk.
+
+        Args:
+            main_audio_bytes (bytes or str): The byte content of the audio file to master, or a path to it.
+            reference_audio_bytes (bytes or str, optional): The byte content of, or path to, a reference track.
+            bit_depth (int): Output bit depth.
+            dither_option (str): Dithering algorithm.
         """
         print("\n--- Starting Audio Mastering Pipeline ---")
         self.notes = []
         try:
-            self.load_audio_from_bytes(main_audio_bytes, is_reference=False)
+            self._load_audio(main_audio_bytes, is_reference=False)
             if self.audio is None:
                 print("Failed to load main audio. Aborting pipeline.")
                 return
 
             if reference_audio_bytes:
-                self.load_audio_from_bytes(reference_audio_bytes, is_reference=True)
+                self._load_audio(reference_audio_bytes, is_reference=True)
 
             self.prepare_track()
             self.listen_and_note()
@@ -651,9 +1020,6 @@ Make notes on desired EQ adjustments, compression needs, etc. This pipeline will
             self.export_track(bit_depth=bit_depth, dither_option=dither_option)
 
             print("\n--- Mastering Pipeline Finished ---")
-            print("Summary of actions taken:")
-            for note in self.notes:
-                print(f"- {note}")
 
         except RuntimeError as e:
             print(f"\nA runtime error occurred during the mastering pipeline: {e}")
@@ -661,6 +1027,151 @@ Make notes on desired EQ adjustments, compression needs, etc. This pipeline will
         except Exception as e:
             print(f"\nAn unexpected error occurred: {e}")
             self._log_note("Fatal Error", f"Unexpected: {str(e)}")
+        finally:
+            # Failed runs included, so their notes are not lost when verbose is off
+            self._write_notes_summary()
+
+    def run_streaming_pipeline(
+        self,
+        main_audio_bytes,
+        bit_depth=24,
+        dither_option="POW-r 2",
+        block_seconds=2.0,
+    ):
+        """
+        Executes the processing chain block by block to cap peak memory.
+
+        EQ, compression, enhancement, limiting and dither run on blocks of
+        block_seconds, carrying filter memories and envelope gains from one block
+        to the next, and each block is written to the output file as soon as it is
+        processed. Only a few blocks are ever held in memory, so self.audio is not
+        populated. No reference track is used.
+
+        Args:
+            main_audio_bytes (bytes or str): The byte content of the audio file to master, or a path to it.
+            bit_depth (int): Output bit depth.
+            dither_option (str): Dithering algorithm.
+            block_seconds (float): Length of each processing block in seconds.
+        """
+        print("\n--- Starting Streaming Audio Mastering Pipeline ---")
+        self.notes = []
+        try:
+            if not isinstance(main_audio_bytes, (str, os.PathLike)):
+                main_audio_bytes = io.BytesIO(main_audio_bytes)
+            with sf.SoundFile(main_audio_bytes) as source:
+                self.sr = source.samplerate
+                channels = max(source.channels, 2)
+                self._log_note(
+                    "Load Main",
+                    f"Main audio opened for streaming: {self.sr} Hz, {source.channels} channels, {source.frames} samples.",
+                )
+                self._log_note(
+                    "3-6",
+                    f"Streaming EQ, compression, enhancement and limiting in {block_seconds:.1f}s blocks.",
+                )
+                if channels != 2:
+                    self._log_note(
+                        "5",
+                        "Skipping stereo enhancement: Audio is not stereo (requires 2 channels).",
+                    )
+                self._log_note(
+                    "7",
+                    f"Exporting track to {self.output_path} with {bit_depth}-bit and {dither_option} dither.",
+                )
+
+                eq_state = compression_state = enhancement_state = None
+                limiting_state = dither_state = None
+                input_peak = 0.0
+                block_size = max(1, int(self.sr * block_seconds))
+                with sf.SoundFile(
+                    self.output_path,
+                    "w",
+                    samplerate=self.sr,
+                    channels=channels,
+                    subtype=f"PCM_{bit_depth}",
+                ) as sink:
+                    for block in source.blocks(
+                        blocksize=block_size, dtype="float32", always_2d=True
+                    ):
+                        chunk = np.ascontiguousarray(block.T)
+                        if chunk.shape[0] == 1:
+                            chunk = np.concatenate((chunk, chunk), axis=0)
+                        input_peak = max(input_peak, _peak_abs(chunk))
+
+                        chunk, eq_state = self._eq_chunk(chunk, eq_state)
+                        chunk, compression_state = self._compression_chunk(
+                            chunk, compression_state
+                        )
+                        if channels == 2:
+                            chunk, enhancement_state = self._enhancement_chunk(
+                                chunk, enhancement_state
+                            )
+                        chunk, limiting_state = self._limiting_chunk(
+                            chunk, limiting_state
+                        )
+                        chunk, dither_state = self._dither_chunk(
+                            chunk, bit_depth, dither_option, dither_state
+                        )
+                        sink.write(chunk.T)
+
+            input_peak_db = 20 * np.log10(input_peak) if input_peak > 0 else -np.inf
+            self._log_note("1", f"Initial peak level: {input_peak_db:.2f} dBFS.")
+            self._log_note(
+                "7", f"Mastered track exported successfully to {self.output_path}."
+            )
+
+            print("\n--- Streaming Mastering Pipeline Finished ---")
+
+        except RuntimeError as e:
+            print(f"\nA runtime error occurred during the mastering pipeline: {e}")
+            self._log_note("Fatal Error", str(e))
+        except Exception as e:
+            print(f"\nAn unexpected error occurred: {e}")
+            self._log_note("Fatal Error", f"Unexpected: {str(e)}")
+        finally:
+            # Failed runs included, so their notes are not lost when verbose is off
+            self._write_notes_summary()
+
+
+def _run_batch_job(job):
+    """
+    Masters a single track in a worker process and returns its processing notes.
+    """
+    main_audio_bytes, output_path, bit_depth, dither_option = job
+    pipeline = MasteringPipeline(output_path=output_path)
+    pipeline.run_mastering_pipeline(
+        main_audio_bytes, bit_depth=bit_depth, dither_option=dither_option
+    )
+    return pipeline.notes
+
+
+def run_batch(
+    tracks, output_paths, bit_depth=24, dither_option="POW-r 2", max_workers=None
+):
+    """
+    Masters several tracks in parallel, one worker process per track.
+
+    Args:
+        tracks (list[bytes or str]): The byte content of, or path to, each audio file to master.
+        output_paths (list[str]): The output filename for each track.
+        bit_depth (int): Output bit depth for every track.
+        dither_option (str): Dithering algorithm for every track.
+        max_workers (int, optional): Number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        list[list[str]]: The processing notes of each track, in input order.
+    """
+    if len(tracks) != len(output_paths):
+        raise ValueError("tracks and output_paths must have the same length.")
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = [
+        (track, output_path, bit_depth, dither_option)
+        for track, output_path in zip(tracks, output_paths)
+    ]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_batch_job, jobs))
 
 
 def main():
@@ -668,8 +1179,6 @@ def main():
     Main function to run InstaMaster as a standalone application.
     """
     import argparse
-    import os
-    import sys
     
     # Set up argument parser
     parser = argparse.ArgumentParser(
@@ -721,6 +1230,12 @@ Examples:
         help="Run in test mode with sample audio"
     )
     
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Process in blocks to cap memory use (reference track is ignored)"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -749,27 +1264,27 @@ Examples:
     
     try:
         # Initialize mastering pipeline
-        pipeline = MasteringPipeline(output_path=args.output)
+        pipeline = MasteringPipeline(output_path=args.output, verbose=args.verbose)
         
-        # Read input audio file
+        # Audio files are decoded straight from disk by the pipeline
         print(f"Loading input file: {args.input_file}")
-        with open(args.input_file, 'rb') as f:
-            main_audio_bytes = f.read()
-        
-        # Read reference audio file (if provided)
-        reference_audio_bytes = None
         if args.reference:
             print(f"Loading reference file: {args.reference}")
-            with open(args.reference, 'rb') as f:
-                reference_audio_bytes = f.read()
         
         # Run the mastering pipeline
-        pipeline.run_mastering_pipeline(
-            main_audio_bytes=main_audio_bytes,
-            reference_audio_bytes=reference_audio_bytes,
-            bit_depth=args.bit_depth,
-            dither_option=args.dither
-        )
+        if args.stream:
+            pipeline.run_streaming_pipeline(
+                main_audio_bytes=args.input_file,
+                bit_depth=args.bit_depth,
+                dither_option=args.dither
+            )
+        else:
+            pipeline.run_mastering_pipeline(
+                main_audio_bytes=args.input_file,
+                reference_audio_bytes=args.reference,
+                bit_depth=args.bit_depth,
+                dither_option=args.dither
+            )
         
         print(f"\nMastering completed successfully!")
         print(f"Output file: {args.output}")
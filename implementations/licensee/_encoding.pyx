@@ -0,0 +1,92 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# src/licensee/_encoding.pyx
+
+"""Optional compiled versions of the fixed-layout encoding and permutation hot paths.
+
+Build in place with ``cythonize -i _encoding.pyx``. encoding.py and permutation.py
+fall back to their pure Python implementations when this module is not built.
+"""
+
+from .license_data import ALPHABET, ALPHABET_MAP, TOTAL_BITS
+
+cdef Py_ssize_t _CHARS_LEN = TOTAL_BITS // 5
+cdef Py_ssize_t _BYTES_LEN = (TOTAL_BITS + 7) // 8
+cdef char _alphabet[32]
+cdef signed char _decode[256]
+
+cdef Py_ssize_t _i
+for _i in range(32):
+    _alphabet[_i] = ord(ALPHABET[_i])
+for _i in range(256):
+    _decode[_i] = ALPHABET_MAP.get(chr(_i), -1)
+
+
+def bits_to_chars(const unsigned char[:] bit_bytes) -> str:
+    """Compiled bits_to_chars: 150 MSB-aligned bits to 30 ALPHABET characters."""
+    cdef Py_ssize_t i, bit_pos, byte_index
+    cdef unsigned int window
+    cdef char out[64]
+
+    if bit_bytes.shape[0] != _BYTES_LEN:
+        raise ValueError(f"Expected {_BYTES_LEN} bytes but got {bit_bytes.shape[0]}")
+
+    for i in range(_CHARS_LEN):
+        bit_pos = 5 * i
+        byte_index = bit_pos >> 3
+        # Two-byte window holding the whole 5-bit group
+        window = bit_bytes[byte_index] << 8
+        if byte_index + 1 < _BYTES_LEN:
+            window |= bit_bytes[byte_index + 1]
+        out[i] = _alphabet[(window >> (11 - (bit_pos & 7))) & 0x1F]
+    return out[:_CHARS_LEN].decode("ascii")
+
+
+def chars_to_bits(str encoded_chars) -> bytes:
+    """Compiled chars_to_bits: 30 ALPHABET characters to 150 MSB-aligned bits."""
+    cdef Py_ssize_t i = 0, bit_pos, byte_index
+    cdef Py_UCS4 char
+    cdef int code
+    cdef unsigned int window
+    cdef unsigned char out[64]
+
+    if len(encoded_chars) != _CHARS_LEN:
+        raise ValueError(
+            f"Expected {_CHARS_LEN} characters but got {len(encoded_chars)}"
+        )
+
+    for byte_index in range(_BYTES_LEN):
+        out[byte_index] = 0
+    for char in encoded_chars:
+        code = _decode[char] if char < 256 else -1
+        if code < 0:
+            raise ValueError(f"Invalid character in encoded string: {char}")
+        bit_pos = 5 * i
+        byte_index = bit_pos >> 3
+        window = code << (11 - (bit_pos & 7))
+        out[byte_index] |= window >> 8
+        if byte_index + 1 < _BYTES_LEN:
+            out[byte_index + 1] |= window & 0xFF
+        i += 1
+    return out[:_BYTES_LEN]
+
+
+def scatter_ascii(str input_chars, const Py_ssize_t[::1] destinations) -> str:
+    """Moves the character at position i of an ASCII string to destinations[i]."""
+    cdef bytes source = input_chars.encode("ascii")
+    cdef const unsigned char* src = source
+    cdef Py_ssize_t n = len(source), i, destination
+    cdef bytearray scattered = bytearray(n)
+    cdef unsigned char* out = scattered
+
+    if destinations.shape[0] != n:
+        raise ValueError(
+            f"Expected {n} destinations but got {destinations.shape[0]}"
+        )
+    for i in range(n):
+        destination = destinations[i]
+        if destination < 0 or destination >= n:
+            raise IndexError(
+                f"index {destination} is out of bounds for axis 0 with size {n}"
+            )
+        out[destination] = src[i]
+    return scattered.decode("ascii")
@@ -1,11 +1,11 @@
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.primitives import serialization
-from typing import Optional
+from typing import List, Optional, Tuple
+import functools
+import hashlib
 import os
+import warnings
+
+# cryptography is imported inside the functions that use it, so importing this
+# module (e.g. by a CLI that only encodes keys) does not load it.
 
 # In a real application, you would securely load your private and public keys.
 # For demonstration, we'll define placeholders for key loading functions.
@@ -14,35 +14,90 @@ import os
 def load_private_key():
     """Loads the private key for signing (should be securely stored)."""
     # This is a placeholder. In a real application, load from a secure file or environment variable.
-    # Example: return serialization.load_pem_private_key(pem_data, password=None, backend=default_backend())
+    # Example: return serialization.load_pem_private_key(pem_data, password=None)
     raise NotImplementedError("Private key loading not implemented.")
 
 
 def load_public_key():
     """Loads the public key for verification (bundled with the application)."""
     # This is a placeholder. In a real application, load from a file bundled with the app.
-    # Example: return serialization.load_pem_public_key(pem_data, backend=default_backend())
+    # Example: return serialization.load_pem_public_key(pem_data)
     # For testing, we can generate a key pair and use the public key from that.
     # In a real scenario, the public key is separate and only the private key is used for signing.
 
-    # For demonstration purposes, let's create a dummy key pair.
+    # For demonstration purposes, return a dummy public key.
     # IMPORTANT: Replace this with actual secure public key loading in production!
     # This function is still needed for the main app's validation logic.
-    private_key = rsa.generate_private_key(
-        public_exponent=65537, key_size=2048, backend=default_backend()
+    warnings.warn(
+        "load_public_key() returns a throwaway demonstration key; "
+        "load the application's public key with load_public_key_from_path().",
+        RuntimeWarning,
+        stacklevel=2,
     )
+    return _get_test_public_key()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_test_public_key():
+    """Generates the demonstration public key once per process.
+
+    RSA-2048 key generation takes tens to hundreds of milliseconds, so it must not
+    run on every load_public_key() call.
+    """
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
     return private_key.public_key()
 
 
 # --- Key Loading from Path ---
+def _key_file_identity(file_path: str):
+    """Returns (real path, mtime_ns, size) so a rewritten key file misses the cache."""
+    real_path = os.path.realpath(file_path)
+    stat_result = os.stat(real_path)
+    return real_path, stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _read_key_file(file_path: str) -> bytes:
+    """Reads a (small) key file with a single read on a raw descriptor."""
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_private_key_cached(
+    real_path: str, mtime_ns: int, size: int, password: Optional[bytes]
+):
+    """Parses a PEM private key once per (path, mtime, size, password)."""
+    from cryptography.hazmat.primitives import serialization
+
+    return serialization.load_pem_private_key(_read_key_file(real_path), password)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_public_key_cached(real_path: str, mtime_ns: int, size: int):
+    """Parses a PEM public key once per (path, mtime, size)."""
+    from cryptography.hazmat.primitives import serialization
+
+    return serialization.load_pem_public_key(_read_key_file(real_path))
+
+
+def clear_key_cache():
+    """Drops every cached key loaded by the *_from_path loaders."""
+    _load_private_key_cached.cache_clear()
+    _load_public_key_cached.cache_clear()
+
+
 def load_private_key_from_path(file_path: str, password: Optional[bytes] = None):
-    """Loads a private key from a file path."""
+    """Loads a private key from a file path.
+
+    The parsed key is cached until the file's mtime or size changes.
+    """
     try:
-        with open(file_path, "rb") as key_file:
-            private_key = serialization.load_pem_private_key(
-                key_file.read(), password, backend=default_backend()
-            )
-        return private_key
+        return _load_private_key_cached(*_key_file_identity(file_path), password)
     except FileNotFoundError:
         raise FileNotFoundError(f"Private key file not found at: {file_path}")
     except Exception as e:
@@ -50,13 +105,12 @@ def load_private_key_from_path(file_path: str, password: Optional[bytes] = None)
 
 
 def load_public_key_from_path(file_path: str):
-    """Loads a public key from a file path."""
+    """Loads a public key from a file path.
+
+    The parsed key is cached until the file's mtime or size changes.
+    """
     try:
-        with open(file_path, "rb") as key_file:
-            public_key = serialization.load_pem_public_key(
-                key_file.read(), backend=default_backend()
-            )
-        return public_key
+        return _load_public_key_cached(*_key_file_identity(file_path))
     except FileNotFoundError:
         raise FileNotFoundError(f"Public key file not found at: {file_path}")
     except Exception as e:
@@ -66,9 +120,9 @@ def load_public_key_from_path(file_path: str):
 # --- Key Generation ---
 def generate_rsa_key_pair(key_size: int = 2048):
     """Generates a new RSA public and private key pair."""
-    private_key = rsa.generate_private_key(
-        public_exponent=65537, key_size=key_size, backend=default_backend()
-    )
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
     public_key = private_key.public_key()
     return private_key, public_key
 
@@ -78,6 +132,8 @@ def save_private_key_to_file(
     private_key, file_path: str, password: Optional[bytes] = None
 ):
     """Saves a private key to a file in PEM format."""
+    from cryptography.hazmat.primitives import serialization
+
     try:
         # Use BestAvailableEncryption if password is provided, NoEncryption otherwise
         encryption_algorithm = (
@@ -98,6 +154,8 @@ def save_private_key_to_file(
 
 def save_public_key_to_file(public_key, file_path: str):
     """Saves a public key to a file in PEM format."""
+    from cryptography.hazmat.primitives import serialization
+
     try:
         pem = public_key.public_bytes(
             encoding=serialization.Encoding.PEM,
@@ -110,36 +168,300 @@ def save_public_key_to_file(public_key, file_path: str):
 
 
 # --- Signing and Verification ---
-def sign_data(data: bytes, private_key) -> bytes:
-    """Signs data using the provided private key."""
-    # Use OAEP padding for encryption, PSS for signing (recommended)
-    signature = private_key.sign(
-        data,
-        padding.PSS(
-            mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
-        ),
-        hashes.SHA256(),
+# Data is hashed once with hashlib and the digest signed as Prehashed SHA-256.
+# The signatures are identical in form to signing the data directly.
+
+# Signatures that already verified, keyed by (digest, signature, public numbers)
+_VERIFY_CACHE_SIZE = 1024
+_verified_signatures = {}
+
+# Deterministic signatures already produced, keyed by (digest, public numbers)
+_SIGN_CACHE_SIZE = 1024
+_deterministic_signatures = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _rsa_pss_sha256(deterministic: bool = False):
+    """Returns the shared (PSS padding, Prehashed SHA-256) pair for sign/verify.
+
+    deterministic selects a zero-length salt, which makes the signature a pure
+    function of (key, data); verification with the default padding accepts it.
+    Both objects are immutable, so one instance serves every call and thread. Built
+    on first use to keep cryptography out of module import.
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+    from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+
+    pss = padding.PSS(
+        mgf=padding.MGF1(hashes.SHA256()),
+        salt_length=0 if deterministic else padding.PSS.MAX_LENGTH,
     )
+    return pss, Prehashed(hashes.SHA256())
+
+
+def sign_data(data: bytes, private_key, deterministic: bool = False) -> bytes:
+    """Signs data using the provided private key.
+
+    With deterministic=True the PSS salt is empty, so no randomness is drawn and
+    signing the same data with the same key always gives the same signature.
+    """
+    digest = hashlib.sha256(data).digest()
+    # Use OAEP padding for encryption, PSS for signing (recommended)
+    pss, prehashed = _rsa_pss_sha256(deterministic)
+    signature = private_key.sign(digest, pss, prehashed)
     return signature
 
 
-def verify_signature(data: bytes, signature: bytes, public_key) -> bool:
-    """Verifies a signature using the provided public key."""
+def sign_data_cached(data: bytes, private_key) -> bytes:
+    """Signs data deterministically, reusing signatures already produced.
+
+    Opt in where the set of signed data is bounded (e.g. re-issuing the same
+    licenses); the cache holds up to _SIGN_CACHE_SIZE signatures.
+    """
+    digest = hashlib.sha256(data).digest()
+    cache_key = (digest, private_key.public_key().public_numbers())
+    signature = _deterministic_signatures.get(cache_key)
+    if signature is None:
+        signature = private_key.sign(digest, *_rsa_pss_sha256(True))
+        if len(_deterministic_signatures) >= _SIGN_CACHE_SIZE:
+            _deterministic_signatures.clear()
+        _deterministic_signatures[cache_key] = signature
+    return signature
+
+
+def _verify_digest(digest: bytes, signature: bytes, public_key, public_numbers) -> bool:
+    """Verifies a signature over a SHA-256 digest, consulting the verified cache."""
+    from cryptography.exceptions import InvalidSignature
+
+    cache_key = (digest, signature, public_numbers)
+    if cache_key in _verified_signatures:
+        return True
     try:
-        public_key.verify(
-            signature,
-            data,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()), salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256(),
+        public_key.verify(signature, digest, *_rsa_pss_sha256())
+    except InvalidSignature:
+        return False  # Signature is invalid
+    if len(_verified_signatures) >= _VERIFY_CACHE_SIZE:
+        _verified_signatures.clear()
+    _verified_signatures[cache_key] = True
+    return True  # Signature is valid
+
+
+def verify_signature(data: bytes, signature: bytes, public_key) -> bool:
+    """Verifies a signature using the provided public key.
+
+    A signature that verified once is remembered for its (data digest, key), so
+    checking it again skips the RSA operation. Only an invalid signature returns
+    False; other errors (e.g. a key of the wrong type) propagate.
+    """
+    return _verify_digest(
+        hashlib.sha256(data).digest(),
+        signature,
+        public_key,
+        public_key.public_numbers(),
+    )
+
+
+def verify_many(
+    data_list: List[bytes], signatures: List[bytes], public_key
+) -> List[bool]:
+    """Verifies many (data, signature) pairs against one public key.
+
+    Equivalent to calling verify_signature on each pair, but the key's public
+    numbers are extracted once for the whole batch. The number of failures is
+    simply results.count(False).
+
+    Raises:
+        ValueError: If data_list and signatures differ in length.
+    """
+    if len(data_list) != len(signatures):
+        raise ValueError(
+            f"Expected {len(data_list)} signatures but got {len(signatures)}"
         )
+    public_numbers = public_key.public_numbers()
+    return [
+        _verify_digest(
+            hashlib.sha256(data).digest(), signature, public_key, public_numbers
+        )
+        for data, signature in zip(data_list, signatures)
+    ]
+
+
+# --- Ed25519 Signing and Verification ---
+# Ed25519 signs roughly 10x faster than RSA-PSS-2048 (verification is slower, as
+# RSA with e=65537 is cheap to verify) and its signatures are 64 bytes instead of
+# 256, so they take 103 ALPHABET characters instead of 410.
+ED25519_SIGNATURE_BIT_LENGTH = 512
+
+
+def generate_ed25519_key_pair():
+    """Generates a new Ed25519 private and public key pair."""
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    return private_key, private_key.public_key()
+
+
+def ed25519_private_key_to_bytes(private_key) -> bytes:
+    """Serializes an Ed25519 private key to its raw 32 bytes (unencrypted)."""
+    from cryptography.hazmat.primitives import serialization
+
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PrivateFormat.Raw,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+def ed25519_public_key_to_bytes(public_key) -> bytes:
+    """Serializes an Ed25519 public key to its raw 32 bytes."""
+    from cryptography.hazmat.primitives import serialization
+
+    return public_key.public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw,
+    )
+
+
+def ed25519_private_key_from_bytes(raw_key: bytes):
+    """Loads an Ed25519 private key from its raw 32 bytes."""
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    return ed25519.Ed25519PrivateKey.from_private_bytes(raw_key)
+
+
+def ed25519_public_key_from_bytes(raw_key: bytes):
+    """Loads an Ed25519 public key from its raw 32 bytes."""
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    return ed25519.Ed25519PublicKey.from_public_bytes(raw_key)
+
+
+def sign_data_ed25519(data: bytes, private_key) -> bytes:
+    """Signs data using the provided Ed25519 private key."""
+    return private_key.sign(data)
+
+
+def verify_signature_ed25519(data: bytes, signature: bytes, public_key) -> bool:
+    """Verifies an Ed25519 signature using the provided public key."""
+    from cryptography.exceptions import InvalidSignature
+
+    try:
+        public_key.verify(signature, data)
         return True  # Signature is valid
     except InvalidSignature:
         return False  # Signature is invalid
-    except Exception as e:
-        print(f"An error occurred during signature verification: {e}")
-        return False
+
+
+# --- Batch Signing (Merkle tree) ---
+# One signature covers a whole batch: each item is a leaf of a Merkle tree, only
+# the root is signed, and every item gets the sibling hashes (its proof) needed
+# to rebuild that root. The root itself is always signed as SHA-256 (the RSA-PSS
+# hash); hash_alg only selects the hash used inside the tree:
+#   "sha256"  - hashlib SHA-256 (default)
+#   "blake2b" - hashlib BLAKE2b with a 32-byte digest, faster in software
+#   "blake3"  - BLAKE3, fastest on long items; needs the optional blake3 package
+# The verifier must use the hash_alg the batch was signed with.
+_MERKLE_LEAF_PREFIX = b"\x00"  # Domain separation between leaves and nodes
+_MERKLE_NODE_PREFIX = b"\x01"
+
+
+def _sha256_digest(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+def _blake2b_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+def _merkle_hash(hash_alg: str):
+    """Returns the bytes -> 32-byte digest function for a Merkle hash_alg."""
+    if hash_alg == "sha256":
+        return _sha256_digest
+    if hash_alg == "blake2b":
+        return _blake2b_digest
+    if hash_alg == "blake3":
+        try:
+            from blake3 import blake3
+        except ImportError:
+            raise ImportError(
+                "hash_alg='blake3' requires the blake3 package (pip install blake3)."
+            ) from None
+        return lambda data: blake3(data).digest()
+    raise ValueError(f"Unsupported Merkle hash_alg: {hash_alg}")
+
+
+def _merkle_leaf(data: bytes, hash_fn) -> bytes:
+    return hash_fn(_MERKLE_LEAF_PREFIX + data)
+
+
+def _merkle_node(left: bytes, right: bytes, hash_fn) -> bytes:
+    return hash_fn(_MERKLE_NODE_PREFIX + left + right)
+
+
+def _merkle_root_from_proof(
+    leaf: bytes, proof: List[Tuple[bool, bytes]], hash_fn
+) -> bytes:
+    """Walks a proof of (sibling_is_left, sibling_hash) steps from a leaf to the root."""
+    node = leaf
+    for sibling_is_left, sibling in proof:
+        node = (
+            _merkle_node(sibling, node, hash_fn)
+            if sibling_is_left
+            else _merkle_node(node, sibling, hash_fn)
+        )
+    return node
+
+
+def sign_batch(data_list: List[bytes], private_key, hash_alg: str = "sha256"):
+    """Signs many items with a single signature over their Merkle root.
+
+    Returns:
+        (root_signature, proofs) where proofs[i] is the list of
+        (sibling_is_left, sibling_hash) steps for data_list[i].
+    """
+    if not data_list:
+        raise ValueError("Cannot sign an empty batch.")
+    hash_fn = _merkle_hash(hash_alg)
+
+    level = [_merkle_leaf(data, hash_fn) for data in data_list]
+    # positions[i] is the index of item i's ancestor in the current level
+    positions = list(range(len(data_list)))
+    proofs = [[] for _ in data_list]
+    while len(level) > 1:
+        for item, pos in enumerate(positions):
+            sibling = pos ^ 1
+            if sibling < len(level):
+                proofs[item].append((sibling < pos, level[sibling]))
+        # An unpaired last node is carried up unchanged
+        next_level = [
+            _merkle_node(level[i], level[i + 1], hash_fn)
+            for i in range(0, len(level) - 1, 2)
+        ]
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+        positions = [pos // 2 for pos in positions]
+
+    root_signature = sign_data(level[0], private_key)
+    return root_signature, proofs
+
+
+def verify_batch(
+    data: bytes,
+    proof: List[Tuple[bool, bytes]],
+    root_signature: bytes,
+    public_key,
+    hash_alg: str = "sha256",
+) -> bool:
+    """Verifies one item of a batch signed by sign_batch with the same hash_alg.
+
+    verify_signature remembers a verified root, so the RSA verification runs once
+    per batch; later items of the same batch only cost the proof's hashes.
+    """
+    hash_fn = _merkle_hash(hash_alg)
+    root = _merkle_root_from_proof(_merkle_leaf(data, hash_fn), proof, hash_fn)
+    return verify_signature(root, root_signature, public_key)
 
 
 # Example Usage (within crypto.py) - Update to test new functions
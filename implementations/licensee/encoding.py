@@ -1,12 +1,71 @@
 # src/licensee/encoding.py
 
+import numpy as np
+
 from .license_data import ALPHABET, ALPHABET_MAP, TOTAL_BITS
 
 # Number of characters in the encoded string (150 bits / 5 bits/char = 30 chars)
 ENCODED_CHARS_LEN = TOTAL_BITS // 5
 
+# ALPHABET as ASCII codes, indexed by 5-bit value
+_ALPHABET_ARR = np.frombuffer(ALPHABET.encode("ascii"), dtype=np.uint8)
+# Bit weights of one MSB-first 5-bit group
+_WEIGHTS = np.array([16, 8, 4, 2, 1], dtype=np.uint8)
+# Maps each ASCII byte to its 5-bit value (bytes outside ALPHABET map to 0xFF)
+_INVALID_CODE = 0xFF
+_DECODE_LUT = bytes(ALPHABET_MAP.get(chr(i), _INVALID_CODE) for i in range(256))
+
+# The fixed 150-bit form is handled ten bits (two characters) at a time with
+# these tables instead of the general NumPy path
+assert TOTAL_BITS % 10 == 0, "The 150-bit fast path works on 10-bit pairs."
+_BIT_BYTES_LEN = (TOTAL_BITS + 7) // 8
+_PAD_BITS = _BIT_BYTES_LEN * 8 - TOTAL_BITS
+_PAIR_SHIFTS = tuple(range(TOTAL_BITS - 10, -1, -10))
+_PAIR_SLICES = tuple(slice(i, i + 2) for i in range(0, ENCODED_CHARS_LEN, 2))
+_PAIRS = tuple(ALPHABET[i >> 5] + ALPHABET[i & 0x1F] for i in range(1024))
+_PAIR_MAP = {pair: i for i, pair in enumerate(_PAIRS)}
+
+
+def _alphabet_codes(data: bytes, num_chars: int) -> np.ndarray:
+    """Returns the ASCII codes of the ALPHABET characters for the first num_chars * 5 bits of data.
+
+    Bits are taken MSB first; bits past the end of data are taken as zeros.
+    """
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=num_chars * 5)
+    return _ALPHABET_ARR[bits.reshape(num_chars, 5) @ _WEIGHTS]
+
+
+def _encode_5bit_groups(data: bytes, num_chars: int) -> str:
+    """Encodes the first num_chars * 5 bits of data (MSB first) as ALPHABET characters."""
+    return _alphabet_codes(data, num_chars).tobytes().decode("ascii")
+
 
-def bits_to_chars(bit_bytes: bytes) -> str:
+def _decode_5bit_groups(chars: str, error_context: str) -> np.ndarray:
+    """Returns the MSB-first bits (5 per character) encoded by a string of ALPHABET characters.
+
+    Raises:
+        ValueError: If chars contains a character outside ALPHABET.
+    """
+    try:
+        raw = chars.encode("ascii")
+    except UnicodeEncodeError as e:
+        raise ValueError(
+            f"Invalid character in {error_context}: {e.object[e.start]}"
+        ) from None
+    # One translate both decodes and validates: invalid bytes become 0xFF
+    translated = raw.translate(_DECODE_LUT)
+    invalid_at = translated.find(_INVALID_CODE)
+    if invalid_at >= 0:
+        raise ValueError(
+            f"Invalid character in {error_context}: {chr(raw[invalid_at])}"
+        )
+
+    codes = np.frombuffer(translated, dtype=np.uint8)
+    # Each code sits in the low 5 bits of its byte
+    return np.unpackbits(codes).reshape(-1, 8)[:, 3:].ravel()
+
+
+def _py_bits_to_chars(bit_bytes: bytes) -> str:
     """Converts a 150-bit byte sequence into a 30-character string using ALPHABET.
 
     Args:
@@ -18,37 +77,17 @@ def bits_to_chars(bit_bytes: bytes) -> str:
     Raises:
         ValueError: If the input byte length is incorrect.
     """
-    bytes_expected = (TOTAL_BITS + 7) // 8
+    bytes_expected = _BIT_BYTES_LEN
     if len(bit_bytes) != bytes_expected:
         raise ValueError(f"Expected {bytes_expected} bytes but got {len(bit_bytes)}")
 
-    # Convert bytes to a single integer
-    all_bits = int.from_bytes(bit_bytes, byteorder="big")
-
-    # The bits are packed aligned to the MSB of the bytes. Need to shift right
-    # to align the LSB of the 150 bits to the LSB of the integer.
-    bits_to_discard = bytes_expected * 8 - TOTAL_BITS
-    all_bits >>= bits_to_discard
-
-    encoded_chars = []
-    # Extract 5 bits at a time from MSB to LSB
-    for i in range(ENCODED_CHARS_LEN):
-        # Calculate the position of the 5-bit chunk from the right (LSB)
-        # For the first character (i=0), we want the bits from pos 145 to 149 (150 - 5*(0+1))
-        # For the last character (i=29), we want the bits from pos 0 to 4 (150 - 5*(29+1))
-        # The integer 'all_bits' has the 150 bits in its lower bits.
-        # We need to extract the 5-bit chunk that corresponds to the i-th character.
-        # The i-th character corresponds to bits (TOTAL_BITS - 5*(i+1)) to (TOTAL_BITS - 5*i - 1)
-        # To get these bits, shift right by (TOTAL_BITS - 5*(i+1)) and mask with 0b11111 (31)
-
-        bit_position = TOTAL_BITS - 5 * (i + 1)
-        five_bits = (all_bits >> bit_position) & 0x1F
-        encoded_chars.append(ALPHABET[five_bits])
+    # The 150 bits are aligned to the MSB of the bytes; drop the padding bits and
+    # emit two characters per 10-bit group
+    all_bits = int.from_bytes(bit_bytes, byteorder="big") >> _PAD_BITS
+    return "".join([_PAIRS[(all_bits >> shift) & 0x3FF] for shift in _PAIR_SHIFTS])
 
-    return "".join(encoded_chars)
 
-
-def chars_to_bits(encoded_chars: str) -> bytes:
+def _py_chars_to_bits(encoded_chars: str) -> bytes:
     """Converts a 30-character string from ALPHABET into a 150-bit byte sequence.
 
     Args:
@@ -66,24 +105,16 @@ def chars_to_bits(encoded_chars: str) -> bytes:
         )
 
     all_bits = 0
-    # Convert characters back to 5-bit values and build the integer
-    for char in encoded_chars:
-        if char not in ALPHABET_MAP:
-            raise ValueError(f"Invalid character in encoded string: {char}")
-        five_bits = ALPHABET_MAP[char]
-        all_bits = (all_bits << 5) | five_bits
-
-    # The integer 'all_bits' now contains the 150 bits in its lower bits.
-    # We need to pack this into bytes, aligning the MSB of our data to the MSB of the bytes.
-    bytes_needed = (TOTAL_BITS + 7) // 8
-    # Shift left to align the most significant bit of our data to the MSB of the bytes
-    aligned_bits = all_bits << (bytes_needed * 8 - TOTAL_BITS)
+    try:
+        for pair in _PAIR_SLICES:
+            all_bits = (all_bits << 10) | _PAIR_MAP[encoded_chars[pair]]
+    except KeyError:
+        # Let the general decoder report the offending character
+        _decode_5bit_groups(encoded_chars, "encoded string")
+        raise
 
-    # Convert the integer to bytes (big-endian)
-    # Use to_bytes with the calculated number of bytes and byteorder
-    packed_bytes = aligned_bits.to_bytes(bytes_needed, byteorder="big")
-
-    return packed_bytes
+    # Align the most significant bit of our data to the MSB of the bytes
+    return (all_bits << _PAD_BITS).to_bytes(_BIT_BYTES_LEN, byteorder="big")
 
 
 def bytes_to_alphabet_string(input_bytes: bytes) -> str:
@@ -91,31 +122,40 @@ def bytes_to_alphabet_string(input_bytes: bytes) -> str:
 
     Pads with zeros if needed at the end to complete 5-bit chunks implicitly.
     """
-    all_bits = int.from_bytes(input_bytes, byteorder="big")
-    total_bits = len(input_bytes) * 8
+    # No explicit padding characters needed if the decoder knows the expected bit length.
+    # The number of output characters will be ceil(total_bits / 5).
+    return _encode_5bit_groups(input_bytes, -(-len(input_bytes) * 8 // 5))
 
-    encoded_chars = []
-    bits_remaining = total_bits
 
-    while bits_remaining > 0:
-        # Determine how many bits to take in this chunk (up to 5)
-        bits_to_take = min(5, bits_remaining)
-        # Extract the relevant bits from the integer
-        # Shift right to isolate the current 5-bit chunk (from the MSB side)
-        shift_amount = bits_remaining - bits_to_take
-        five_bits = (all_bits >> shift_amount) & ((1 << bits_to_take) - 1)
+def bytes_to_permuted_alphabet_string(
+    input_bytes: bytes, permutation_array: np.ndarray
+) -> str:
+    """Encodes bytes with bytes_to_alphabet_string and permutes the result, in one pass.
 
-        # If we took fewer than 5 bits, shift left to align for alphabet lookup
-        if bits_to_take < 5:
-            five_bits <<= 5 - bits_to_take
+    Equivalent to apply_permutation(bytes_to_alphabet_string(input_bytes), map) but
+    scatters the character codes straight into their permuted positions, without
+    building the intermediate string.
 
-        encoded_chars.append(ALPHABET[five_bits])
-        bits_remaining -= bits_to_take
+    Args:
+        input_bytes: The bytes to encode.
+        permutation_array: The permutation as an index array (original_index -> new_index),
+                           e.g. from permutation.get_permutation_array.
 
-    # No explicit padding characters needed if the decoder knows the expected bit length.
-    # The number of output characters will be ceil(total_bits / 5).
+    Returns:
+        The permuted encoded string.
 
-    return "".join(encoded_chars)
+    Raises:
+        ValueError: If the permutation size does not match the encoded length.
+    """
+    num_chars = -(-len(input_bytes) * 8 // 5)
+    if len(permutation_array) != num_chars:
+        raise ValueError(
+            f"Expected permutation of size {num_chars} but got {len(permutation_array)}"
+        )
+    codes = _alphabet_codes(input_bytes, num_chars)
+    permuted = np.empty_like(codes)
+    permuted[permutation_array] = codes
+    return permuted.tobytes().decode("ascii")
 
 
 def alphabet_string_to_bytes(input_string: str, expected_total_bits: int) -> bytes:
@@ -131,32 +171,23 @@ def alphabet_string_to_bytes(input_string: str, expected_total_bits: int) -> byt
     Raises:
         ValueError: If input string contains invalid characters or insufficient bits.
     """
-    all_bits = 0
-    total_bits_read = 0
-    for char in input_string:
-        if char not in ALPHABET_MAP:
-            raise ValueError(f"Invalid character in string: {char}")
-        five_bits = ALPHABET_MAP[char]
-        all_bits = (all_bits << 5) | five_bits
-        total_bits_read += 5
-
-    if total_bits_read < expected_total_bits:
+    bits = _decode_5bit_groups(input_string, "string")
+
+    if bits.size < expected_total_bits:
         raise ValueError(
             f"Input string contains less than expected {expected_total_bits} bits."
         )
 
-    # The integer 'all_bits' now contains the bits.
-    # We need to extract the most significant `expected_total_bits`.
-    # If total_bits_read > expected_total_bits, we need to shift right.
-    bits_to_discard = total_bits_read - expected_total_bits
-    all_bits >>= bits_to_discard
-
-    bytes_needed = (expected_total_bits + 7) // 8
+    # Keep the most significant `expected_total_bits`, aligned to the MSB of the bytes
+    return np.packbits(bits[:expected_total_bits]).tobytes()
 
-    # Shift left to align the most significant bit of our data to the MSB of the bytes
-    aligned_bits = all_bits << (bytes_needed * 8 - expected_total_bits)
 
-    return aligned_bits.to_bytes(bytes_needed, byteorder="big")
+try:
+    # Compiled fixed-layout codec, built from _encoding.pyx when Cython is available
+    from ._encoding import bits_to_chars, chars_to_bits
+except ImportError:
+    bits_to_chars = _py_bits_to_chars
+    chars_to_bits = _py_chars_to_bits
 
 
 # Example Usage (within encoding.py)
@@ -10,9 +10,8 @@ from datetime import datetime, timezone, timedelta
 from .license_data import LicenseData, BIT_ALLOCATIONS, TOTAL_BITS, ALPHABET
 from .encoding import bits_to_chars, chars_to_bits, ENCODED_CHARS_LEN
 from .permutation import (
-    get_permutation_map,
-    get_inverse_permutation_map,
-    apply_permutation,
+    get_permutation_array,
+    get_permutation_pair,
     apply_inverse_permutation,
     TOTAL_CHARS_TO_PERMUTE,
 )
@@ -22,7 +21,10 @@ from .crypto import (
     sign_data,
     verify_signature,
 )  # Make sure to replace load_public_key with actual loading in production
-from .encoding import bytes_to_alphabet_string, alphabet_string_to_bytes
+from .encoding import (
+    bytes_to_permuted_alphabet_string,
+    alphabet_string_to_bytes,
+)
 
 # Define a consistent epoch start date (e.g., beginning of 2024 UTC)
 EPOCH_START_DATE = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
@@ -180,15 +182,15 @@ def generate_license_key(
     # 4. Encode combined bytes into characters (using our ALPHABET)
     # Total bits = 150 (license) + 2048 (signature) = 2198 bits
     # Characters needed = ceil(2198 / 5) = 440 characters
-    original_440_chars = bytes_to_alphabet_string(combined_bytes)
-
     # 5. Apply Sine Permutation to the 440 characters
+    # Both steps run as one pass, scattering each encoded character straight to
+    # its permuted position.
     # Get the swap_param used (either random or fixed)
     actual_swap_param_for_permutation = swap_param
 
-    perm_map = get_permutation_map(actual_swap_param_for_permutation)
-    # Permute the entire 440 characters string
-    permuted_440_chars = apply_permutation(original_440_chars, perm_map)
+    perm_array = get_permutation_array(actual_swap_param_for_permutation)
+    # Encode and permute the entire 440 characters string
+    permuted_440_chars = bytes_to_permuted_alphabet_string(combined_bytes, perm_array)
 
     # 6. Format Final Key by segmenting the 440 permuted characters
     # Break the 440 permuted characters into 5-char segments (440 / 5 = 88 segments)
@@ -301,8 +303,7 @@ def validate_license_key(
         if hardcoded_swap_param is not None:
             try:
                 # Attempt un-permutation and unpacking with the hardcoded param
-                perm_map = get_permutation_map(hardcoded_swap_param)
-                inv_perm_map = get_inverse_permutation_map(perm_map)
+                _, inv_perm_map = get_permutation_pair(hardcoded_swap_param)
                 original_chars = apply_inverse_permutation(permuted_chars, inv_perm_map)
                 original_bit_bytes = chars_to_bits(original_chars)
                 unpacked_data = LicenseData.from_bits(original_bit_bytes)
@@ -330,8 +331,7 @@ def validate_license_key(
 
                 try:
                     # Attempt un-permutation and unpacking with the current swap_param guess
-                    perm_map = get_permutation_map(current_swap_param)
-                    inv_perm_map = get_inverse_permutation_map(perm_map)
+                    _, inv_perm_map = get_permutation_pair(current_swap_param)
                     original_chars = apply_inverse_permutation(
                         permuted_chars, inv_perm_map
                     )
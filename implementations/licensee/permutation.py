@@ -1,63 +1,139 @@
 # src/licensee/permutation.py
 
-import math
-from typing import List
+import functools
+from typing import Sequence, Tuple
+
+import numpy as np
+
+try:
+    # Compiled scatter, built from _encoding.pyx when Cython is available
+    from ._encoding import scatter_ascii as _scatter_ascii
+except ImportError:
+    _scatter_ascii = None
 
 # Define the total number of characters to be permuted
 TOTAL_CHARS_TO_PERMUTE = 440
 
+# Index ramps shared by every get_permutation_map call
+_INDICES = np.arange(TOTAL_CHARS_TO_PERMUTE, dtype=np.float64)
+_INDEX_PHASES = _INDICES * 0.2
+_RANKS = np.arange(TOTAL_CHARS_TO_PERMUTE, dtype=np.int64)
 
-def get_permutation_map(swap_param: float) -> List[int]:
+
+def get_permutation_map(swap_param: float) -> Tuple[int, ...]:
     """Generates a permutation map based on the swap_param and sine function.
 
-    The map is a list where the index is the original position (0-29)
-    and the value is the new position (0-29).
+    The map is a tuple where the index is the original position (0-29)
+    and the value is the new position (0-29). Maps are cached per swap_param,
+    so callers that need to modify one should take a list() copy.
+
+    Args:
+        swap_param: A float value between 0.0 and 1.0.
+
+    Returns:
+        A tuple representing the permutation map.
+    """
+    return get_permutation_pair(swap_param)[0]
+
+
+@functools.lru_cache(maxsize=1024)
+def get_permutation_pair(
+    swap_param: float,
+) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """Generates the permutation map for swap_param together with its inverse.
+
+    Both come from one sort: the sorted order of original indices is exactly the
+    inverse map (new_index -> original_index). Pairs are cached per swap_param.
 
     Args:
         swap_param: A float value between 0.0 and 1.0.
 
     Returns:
-        A list representing the permutation map.
+        (permutation_map, inverse_permutation_map) as tuples.
     """
     if not 0.0 <= swap_param <= 1.0:
         raise ValueError("swap_param must be between 0.0 and 1.0")
 
-    scored_indices = []
-    for i in range(TOTAL_CHARS_TO_PERMUTE):
-        # Calculate a score influenced by the sine wave and swap_param
-        # Using constants K1, K2 to spread values and add sensitivity
-        # The addition of 'i * small_number' helps in differentiating scores
-        # for different indices even with similar sine values.
-        score = math.sin(swap_param * 100.0 + i * 0.2) * 1000.0 + i
-        scored_indices.append((score, i))
+    # Calculate a score influenced by the sine wave and swap_param
+    # Using constants K1, K2 to spread values and add sensitivity
+    # The addition of 'i * small_number' helps in differentiating scores
+    # for different indices even with similar sine values.
+    # Evaluated in place in one buffer; the operations, and so the scores,
+    # are exactly those of sin(swap_param * 100 + i * 0.2) * 1000 + i.
+    scores = _INDEX_PHASES + swap_param * 100.0
+    np.sin(scores, out=scores)
+    scores *= 1000.0
+    scores += _INDICES
 
     # Sort based on the score. This determines the new order of original indices.
-    scored_indices.sort()
+    # A stable sort breaks ties by original index, like sorting (score, i) tuples.
+    sorted_indices = np.argsort(scores, kind="stable")
 
     # Create the permutation map: original_index -> new_index
-    permutation_map = [0] * TOTAL_CHARS_TO_PERMUTE
-    for new_pos, (score, original_pos) in enumerate(scored_indices):
-        permutation_map[original_pos] = new_pos
+    permutation_map = np.empty(TOTAL_CHARS_TO_PERMUTE, dtype=np.int64)
+    permutation_map[sorted_indices] = _RANKS
 
-    return permutation_map
+    return tuple(permutation_map.tolist()), tuple(sorted_indices.tolist())
 
 
-def get_inverse_permutation_map(permutation_map: List[int]) -> List[int]:
+def get_inverse_permutation_map(permutation_map: Sequence[int]) -> Tuple[int, ...]:
     """Generates the inverse permutation map.
 
+    Inverses are cached per map, like the maps themselves.
+
     Args:
         permutation_map: The original permutation map (original_index -> new_index).
 
     Returns:
-        A list representing the inverse permutation map (new_index -> original_index).
+        A tuple representing the inverse permutation map (new_index -> original_index).
     """
+    return _get_inverse_permutation_map_cached(tuple(permutation_map))
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_inverse_permutation_map_cached(
+    permutation_map: Tuple[int, ...],
+) -> Tuple[int, ...]:
     inverse_map = [0] * TOTAL_CHARS_TO_PERMUTE
     for original_pos, new_pos in enumerate(permutation_map):
         inverse_map[new_pos] = original_pos
-    return inverse_map
+    return tuple(inverse_map)
+
+
+@functools.lru_cache(maxsize=1024)
+def _index_array_cached(permutation_map: Tuple[int, ...]) -> np.ndarray:
+    index_array = np.asarray(permutation_map, dtype=np.intp)
+    index_array.setflags(write=False)
+    return index_array
+
+
+def get_permutation_array(swap_param: float) -> np.ndarray:
+    """Returns get_permutation_map(swap_param) as a cached, read-only NumPy index array."""
+    return _index_array_cached(get_permutation_map(swap_param))
+
+
+def _index_array(permutation_map: Sequence[int]) -> np.ndarray:
+    """Returns a map as a NumPy index array; cached for the tuples the map getters return."""
+    if isinstance(permutation_map, tuple):
+        return _index_array_cached(permutation_map)
+    return np.asarray(permutation_map, dtype=np.intp)
 
 
-def apply_permutation(input_chars: str, permutation_map: List[int]) -> str:
+def _scatter_chars(input_chars: str, destinations: Sequence[int]) -> str:
+    """Moves the character at position i of an ASCII string to destinations[i].
+
+    Works on the string's bytes in one buffer and decodes once, without creating
+    a string object per character.
+    """
+    if _scatter_ascii is not None:
+        return _scatter_ascii(input_chars, _index_array(destinations))
+    source = np.frombuffer(input_chars.encode("ascii"), dtype=np.uint8)
+    scattered = np.empty_like(source)
+    scattered[_index_array(destinations)] = source
+    return scattered.tobytes().decode("ascii")
+
+
+def apply_permutation(input_chars: str, permutation_map: Sequence[int]) -> str:
     """Applies a permutation to a string of characters.
 
     Args:
@@ -68,7 +144,7 @@ def apply_permutation(input_chars: str, permutation_map: List[int]) -> str:
         The permuted 30-character string.
 
     Raises:
-        ValueError: If the input string length is incorrect or map is invalid.
+        ValueError: If the input string length is incorrect, is not ASCII, or map is invalid.
     """
     if len(input_chars) != TOTAL_CHARS_TO_PERMUTE:
         raise ValueError(
@@ -79,17 +155,12 @@ def apply_permutation(input_chars: str, permutation_map: List[int]) -> str:
             f"Expected permutation map of size {TOTAL_CHARS_TO_PERMUTE} but got {len(permutation_map)}"
         )
 
-    # Create a list to build the permuted string
-    permuted_chars = [""] * TOTAL_CHARS_TO_PERMUTE
     # Apply the permutation: character at original_pos moves to new_pos
-    for original_pos, new_pos in enumerate(permutation_map):
-        permuted_chars[new_pos] = input_chars[original_pos]
-
-    return "".join(permuted_chars)
+    return _scatter_chars(input_chars, permutation_map)
 
 
 def apply_inverse_permutation(
-    input_chars: str, inverse_permutation_map: List[int]
+    input_chars: str, inverse_permutation_map: Sequence[int]
 ) -> str:
     """Applies an inverse permutation to a string of characters.
 
@@ -101,7 +172,7 @@ def apply_inverse_permutation(
         The un-permuted 30-character string.
 
     Raises:
-        ValueError: If the input string length is incorrect or map is invalid.
+        ValueError: If the input string length is incorrect, is not ASCII, or map is invalid.
     """
     if len(input_chars) != TOTAL_CHARS_TO_PERMUTE:
         raise ValueError(
@@ -112,13 +183,8 @@ def apply_inverse_permutation(
             f"Expected inverse permutation map of size {TOTAL_CHARS_TO_PERMUTE} but got {len(inverse_permutation_map)}"
         )
 
-    # Create a list to build the un-permuted string
-    original_chars = [""] * TOTAL_CHARS_TO_PERMUTE
     # Apply the inverse permutation: character at new_pos moves to original_pos
-    for new_pos, original_pos in enumerate(inverse_permutation_map):
-        original_chars[original_pos] = input_chars[new_pos]
-
-    return "".join(original_chars)
+    return _scatter_chars(input_chars, inverse_permutation_map)
 
 
 # Example Usage (within permutation.py)
@@ -14,13 +14,29 @@ Version: 2.1.0
 Author: N Lisowski
 """
 
+import importlib
+
 from .cipher import SineScrambleCipher, OperationMode
-from .cipher_optimized import OptimizedSineScrambleCipher
-from .cipher_turbo import TurboSineScrambleCipher
 from .utils import generate_random_key, key_from_password, key_to_string, string_to_key
 
-# Turbo is now the recommended default for high-performance and large data
-FastSineScrambleCipher = TurboSineScrambleCipher
+# The Numba implementations are imported on first access, so code that only
+# uses SineScrambleCipher does not pay for loading Numba (about 0.25 s)
+_LAZY_CIPHERS = {
+    "OptimizedSineScrambleCipher": ("cipher_optimized", "OptimizedSineScrambleCipher"),
+    "TurboSineScrambleCipher": ("cipher_turbo", "TurboSineScrambleCipher"),
+    # Turbo is now the recommended default for high-performance and large data
+    "FastSineScrambleCipher": ("cipher_turbo", "TurboSineScrambleCipher"),
+}
+
+
+def __getattr__(name):
+    """Import the Numba cipher classes on first access"""
+    if name not in _LAZY_CIPHERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, class_name = _LAZY_CIPHERS[name]
+    cipher_class = getattr(importlib.import_module(f".{module_name}", __name__), class_name)
+    globals()[name] = cipher_class
+    return cipher_class
 
 __version__ = "2.1.0"
 __author__ = "N Lisowski"
@@ -0,0 +1,24 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+"""Optional compiled round kernel for SineScrambleCipher.
+
+Build in place with ``cythonize -i _cipher_c.pyx``. cipher.py falls back to
+its NumPy implementation when this module is not built.
+"""
+
+
+def permute_xor(const unsigned char[::1] data, const Py_ssize_t[::1] permutation_map,
+                const unsigned char[::1] substitution_values, unsigned char[::1] out):
+    """Gather data through permutation_map and XOR with substitution_values, into out.
+
+    One pass instead of NumPy's take followed by bitwise_xor, with the GIL
+    released. out must not overlap data.
+    """
+    cdef Py_ssize_t i, n = data.shape[0]
+
+    if permutation_map.shape[0] != n or substitution_values.shape[0] != n or out.shape[0] != n:
+        raise ValueError("permute_xor arguments must all have the length of data")
+
+    with nogil:
+        for i in range(n):
+            out[i] = data[permutation_map[i]] ^ substitution_values[i]
@@ -6,12 +6,50 @@ for both Multi-Round Mode (high security) and Segmented Mode (high performance).
 """
 
 import math
+import os
 import numpy as np
+from collections import OrderedDict
 from enum import Enum
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 import concurrent.futures
 import threading
 
+try:
+    # Compiled round kernel, built from _cipher_c.pyx when Cython is available
+    from ._cipher_c import permute_xor as _permute_xor
+except ImportError:
+    try:
+        from _cipher_c import permute_xor as _permute_xor
+    except ImportError:
+        _permute_xor = None
+
+
+# Number of distinct data sizes whose round tables are cached per key component
+ROUND_TABLE_CACHE_SIZES = 16
+
+# Bytes of tables each cache may hold per cipher; tables for inputs too large
+# to fit are built for the call and not kept (a round costs ~18 bytes per byte)
+ROUND_TABLE_CACHE_BYTES = 128 * 1024 * 1024
+
+# Below this many bytes, segments are processed in the calling thread; handing
+# them to worker threads costs more than it saves
+PARALLEL_SEGMENT_THRESHOLD = 23 * 1024
+
+# Worker threads shared by all ciphers for Segmented Mode, created on first use
+_segment_pool = None
+_segment_pool_lock = threading.Lock()
+
+
+def _get_segment_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the shared Segmented Mode worker pool (one thread per CPU)"""
+    global _segment_pool
+    with _segment_pool_lock:
+        if _segment_pool is None:
+            _segment_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1, thread_name_prefix="sinescramble"
+            )
+    return _segment_pool
+
 
 class OperationMode(Enum):
     """Operation modes for SineScramble cipher"""
@@ -19,6 +57,28 @@ class OperationMode(Enum):
     SEGMENTED = "segmented"
 
 
+def _as_byte_array(data) -> np.ndarray:
+    """View a bytes-like object as a uint8 array, copying only when it is not one buffer"""
+    try:
+        return np.frombuffer(data, dtype=np.uint8)
+    except (TypeError, ValueError, BufferError):
+        return np.frombuffer(bytes(data), dtype=np.uint8)
+
+
+def _as_input_and_output_arrays(data, out) -> Tuple[np.ndarray, np.ndarray]:
+    """View data and a writable output buffer of the same length as uint8 arrays"""
+    data_array = _as_byte_array(data)
+    out_array = np.frombuffer(out, dtype=np.uint8)
+    if not out_array.flags.writeable:
+        raise TypeError(f"Output buffer must be writable, got {type(out).__name__}")
+    if len(out_array) != len(data_array):
+        raise ValueError(f"Output buffer holds {len(out_array)} bytes, expected {len(data_array)}")
+    if np.shares_memory(data_array, out_array):
+        # The rounds read and write different buffers
+        data_array = data_array.copy()
+    return data_array, out_array
+
+
 class SineScrambleCipher:
     """
     SineScramble symmetric cipher implementation
@@ -55,6 +115,16 @@ class SineScrambleCipher:
         
         # Thread lock for parallel processing
         self._lock = threading.Lock()
+        
+        # Per-round tables keyed by (key_component, data_size), least recently used first
+        self._round_tables = OrderedDict()
+        self._max_round_tables = ROUND_TABLE_CACHE_SIZES * self.n
+        
+        # Read-only index arrays, as 1-tuples keyed by data_size, least recently used first
+        self._indices_cache = OrderedDict()
+        
+        # Segmented Mode tables covering whole inputs, keyed by data_size
+        self._segmented_tables = OrderedDict()
     
     def _scoring_function(self, key_component: float, indices: np.ndarray) -> np.ndarray:
         """
@@ -67,142 +137,334 @@ class SineScrambleCipher:
         Returns:
             Array of scores for each index
         """
-        sine_term = self.amplitude * np.sin(key_component * self.phase + indices * self.frequency)
-        return sine_term + indices
+        # Evaluated in place in a single array, in the order the formula reads
+        scores = np.multiply(indices, self.frequency, dtype=np.float64)
+        scores += key_component * self.phase
+        np.sin(scores, out=scores)
+        scores *= self.amplitude
+        scores += indices
+        return scores
+    
+    def _get_indices(self, data_size: int) -> np.ndarray:
+        """
+        Get the read-only index array 0..data_size-1, cached
+        
+        Args:
+            data_size: Number of indices
+            
+        Returns:
+            Read-only np.arange(data_size)
+        """
+        with self._lock:
+            cached = self._indices_cache.get(data_size)
+            if cached is not None:
+                self._indices_cache.move_to_end(data_size)
+                return cached[0]
+        
+        indices = np.arange(data_size)
+        indices.setflags(write=False)
+        
+        self._store_tables(self._indices_cache, data_size, (indices,), ROUND_TABLE_CACHE_SIZES)
+        return indices
     
-    def _generate_permutation_map(self, key_component: float, data_size: int) -> np.ndarray:
+    def _generate_permutation_map(self, key_component: float, data_size: int,
+                                  indices: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Generate permutation map from scores
+        Generate permutation map and its inverse from scores
         
         Args:
             key_component: Key component to use for scoring
             data_size: Size of data to permute
+            indices: Optional np.arange(data_size) to reuse
             
         Returns:
-            Permutation array where output[i] = original_index
+            (permutation_map, inverse_map), where permutation_map is the permutation
+            array with output[i] = original_index and inverse_map undoes it
         """
-        indices = np.arange(data_size)
+        if indices is None:
+            indices = np.arange(data_size)
         scores = self._scoring_function(key_component, indices)
         
         # Sort indices by scores to create permutation map
         permutation_map = np.argsort(scores)
-        return permutation_map
+        inverse_map = np.empty_like(permutation_map)
+        inverse_map[permutation_map] = indices
+        return permutation_map, inverse_map
     
-    def _generate_substitution_mask(self, key_component: float, data_size: int) -> np.ndarray:
+    def _generate_substitution_mask(self, key_component: float, data_size: int,
+                                    indices: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Generate substitution mask from scores
         
         Args:
             key_component: Key component to use for scoring
             data_size: Size of data for substitution
+            indices: Optional np.arange(data_size) to reuse
             
         Returns:
             Boolean mask indicating which bits to flip
         """
-        indices = np.arange(data_size)
+        if indices is None:
+            indices = np.arange(data_size)
         scores = self._scoring_function(key_component, indices)
         
         # Use fractional part of scores to determine substitution
-        # If fractional part > 0.5, flip the bit
-        fractional_scores = scores - np.floor(scores)
+        # If fractional part > 0.5, flip the bit. The integer index has to stay
+        # in the scores: frac(A*sin + i) and frac(A*sin) differ after rounding
+        fractional_scores = np.subtract(scores, np.floor(scores), out=scores)
         substitution_mask = fractional_scores > 0.5
         return substitution_mask
     
-    def _permute_data(self, data: np.ndarray, permutation_map: np.ndarray, inverse: bool = False) -> np.ndarray:
+    def _permute_data(self, data: np.ndarray, permutation_map: np.ndarray,
+                      out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply permutation to data
         
         Args:
             data: Data to permute
-            permutation_map: Permutation mapping
-            inverse: If True, apply inverse permutation
+            permutation_map: Permutation mapping (pass the inverse map from
+                _generate_permutation_map to undo a permutation)
+            out: Optional array to store the result in (must not overlap data)
             
         Returns:
             Permuted data
         """
-        if inverse:
-            # Create inverse permutation
-            inverse_map = np.empty_like(permutation_map)
-            inverse_map[permutation_map] = np.arange(len(permutation_map))
-            return data[inverse_map]
-        else:
-            return data[permutation_map]
+        # Permutation indices are always in range; any mode other than 'raise'
+        # lets np.take write into out without an intermediate buffer. The last
+        # axis is permuted, so a (messages, size) array permutes each message
+        return np.take(data, permutation_map, axis=-1, out=out, mode='wrap')
     
-    def _substitute_data(self, data: np.ndarray, substitution_mask: np.ndarray) -> np.ndarray:
+    def _substitute_data(self, data: np.ndarray, substitution_mask: np.ndarray,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Apply substitution (XOR) to data
         
         Args:
             data: Data to substitute
             substitution_mask: Boolean mask for substitution
+            out: Optional array to store the result in (may be data itself)
             
         Returns:
             Substituted data
         """
         # Convert mask to same dtype as data for XOR operation
-        mask_values = substitution_mask.astype(data.dtype)
-        return data ^ mask_values
+        mask_values = substitution_mask.astype(data.dtype, copy=False)
+        return np.bitwise_xor(data, mask_values, out=out)
     
-    def _transform_round(self, data: np.ndarray, key_component: float, inverse: bool = False) -> np.ndarray:
+    def _get_round_tables(self, key_component: float, data_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
-        Apply one round of transformation (permutation + substitution)
+        Get the permutation tables and substitution mask for one round, cached
+        
+        The tables depend only on (key_component, data_size), so repeated calls
+        with the same block size skip the scoring and sorting entirely.
+        
+        Args:
+            key_component: Key component for the round
+            data_size: Size of the data the round transforms
+            
+        Returns:
+            Read-only (permutation_map, inverse_map, substitution_values,
+            inverse_substitution_values), where inverse_map undoes permutation_map,
+            substitution_values is the substitution mask as uint8 and
+            inverse_substitution_values is that mask permuted by inverse_map
+        """
+        cache_key = (key_component, data_size)
+        with self._lock:
+            tables = self._round_tables.get(cache_key)
+            if tables is not None:
+                self._round_tables.move_to_end(cache_key)
+                return tables
+        
+        tables = self._build_round_tables(key_component, data_size)
+        for table in tables:
+            table.setflags(write=False)
+        
+        self._store_tables(self._round_tables, cache_key, tables, self._max_round_tables)
+        return tables
+    
+    def _store_tables(self, cache: OrderedDict, cache_key, tables: Tuple[np.ndarray, ...],
+                      max_entries: int) -> None:
+        """
+        Cache tables, evicting least recently used entries past max_entries or
+        ROUND_TABLE_CACHE_BYTES
+        
+        Tables larger than the byte budget on their own are not cached.
+        
+        Args:
+            cache: The cache to store into
+            cache_key: Key to store the tables under
+            tables: The tables to store
+            max_entries: Maximum number of entries the cache may hold
+        """
+        if sum(table.nbytes for table in tables) > ROUND_TABLE_CACHE_BYTES:
+            return
+        
+        with self._lock:
+            cache[cache_key] = tables
+            cached_bytes = sum(table.nbytes for entry in cache.values() for table in entry)
+            while len(cache) > max_entries or cached_bytes > ROUND_TABLE_CACHE_BYTES:
+                _, evicted = cache.popitem(last=False)
+                cached_bytes -= sum(table.nbytes for table in evicted)
+    
+    def _build_round_tables(self, key_component: float, data_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Build the uncached tables returned by _get_round_tables
+        
+        Args:
+            key_component: Key component for the round
+            data_size: Size of the data the round transforms
+            
+        Returns:
+            (permutation_map, inverse_map, substitution_values, inverse_substitution_values)
+        """
+        indices = self._get_indices(data_size)
+        permutation_map, inverse_map = self._generate_permutation_map(key_component, data_size, indices)
+        substitution_values = self._generate_substitution_mask(key_component, data_size, indices).astype(np.uint8)
+        return permutation_map, inverse_map, substitution_values, substitution_values[inverse_map]
+    
+    def _get_segmented_tables(self, data_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the tables of every segment combined into tables for the whole input, cached
+        
+        Each segment's permutations are offset to the segment's position, so a
+        single gather and XOR over the whole input processes all segments.
+        
+        Args:
+            data_size: Total size of the data being processed
+            
+        Returns:
+            Read-only tables laid out like those of _get_round_tables
+        """
+        with self._lock:
+            tables = self._segmented_tables.get(data_size)
+            if tables is not None:
+                self._segmented_tables.move_to_end(data_size)
+                return tables
+        
+        segment_size = data_size // self.n
+        segment_tables = []
+        for i in range(self.n):
+            start_idx = i * segment_size
+            if i == self.n - 1:  # Last segment gets remainder
+                end_idx = data_size
+            else:
+                end_idx = (i + 1) * segment_size
+            
+            permutation_map, inverse_map, substitution_values, inverse_substitution_values = (
+                self._build_round_tables(self.key[i], end_idx - start_idx)
+            )
+            segment_tables.append((permutation_map + start_idx, inverse_map + start_idx,
+                                   substitution_values, inverse_substitution_values))
+        tables = tuple(np.concatenate(parts) for parts in zip(*segment_tables))
+        for table in tables:
+            table.setflags(write=False)
+        
+        self._store_tables(self._segmented_tables, data_size, tables, ROUND_TABLE_CACHE_SIZES)
+        return tables
+    
+    def _apply_tables(self, data: np.ndarray, tables: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+                      inverse: bool = False, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Apply round tables from _get_round_tables or _get_segmented_tables
         
         Args:
             data: Data to transform
-            key_component: Key component for this round
+            tables: The tables to apply
             inverse: If True, apply inverse transformation
+            out: Optional array to store the result in (must not overlap data)
             
         Returns:
             Transformed data
         """
-        data_size = len(data)
-        permutation_map = self._generate_permutation_map(key_component, data_size)
-        substitution_mask = self._generate_substitution_mask(key_component, data_size)
+        permutation_map, inverse_map, substitution_values, inverse_substitution_values = tables
+        
+        if _permute_xor is not None and data.ndim == 1:
+            # Both directions are a gather then an XOR, fused by the compiled kernel
+            if out is None:
+                out = np.empty_like(data)
+            if inverse:
+                _permute_xor(data, inverse_map, inverse_substitution_values, out)
+            else:
+                _permute_xor(data, permutation_map, substitution_values, out)
+            return out
         
         if inverse:
-            # For decryption: inverse substitution then inverse permutation
-            data = self._substitute_data(data, substitution_mask)
-            data = self._permute_data(data, permutation_map, inverse=True)
+            # For decryption: inverse substitution then inverse permutation,
+            # done as the inverse permutation then the permuted substitution
+            data = self._permute_data(data, inverse_map, out=out)
+            data = self._substitute_data(data, inverse_substitution_values, out=data)
         else:
             # For encryption: permutation then substitution
-            data = self._permute_data(data, permutation_map, inverse=False)
-            data = self._substitute_data(data, substitution_mask)
+            data = self._permute_data(data, permutation_map, out=out)
+            data = self._substitute_data(data, substitution_values, out=data)
         
         return data
     
-    def _encrypt_multi_round(self, data: np.ndarray) -> np.ndarray:
+    def _transform_round(self, data: np.ndarray, key_component: float, inverse: bool = False,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Apply one round of transformation (permutation + substitution)
+        
+        Args:
+            data: Data to transform
+            key_component: Key component for this round
+            inverse: If True, apply inverse transformation
+            out: Optional array to store the result in (must not overlap data)
+            
+        Returns:
+            Transformed data
+        """
+        tables = self._get_round_tables(key_component, len(data))
+        return self._apply_tables(data, tables, inverse=inverse, out=out)
+    
+    def _encrypt_multi_round(self, data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Encrypt using Multi-Round Mode
         
         Args:
             data: Plaintext data
+            out: Optional array to store the result in (must not overlap data)
             
         Returns:
             Encrypted data
         """
-        current_data = data.copy()
+        # Alternate between two buffers instead of allocating one per round,
+        # arranged so the last round (round n - 1) writes into out
+        output = np.empty_like(data) if out is None else out
+        scratch = np.empty_like(data)
+        buffers = (output, scratch) if (self.n - 1) % 2 == 0 else (scratch, output)
+        current_data = data
         
         # Apply n rounds sequentially
         for i in range(self.n):
-            current_data = self._transform_round(current_data, self.key[i], inverse=False)
+            current_data = self._transform_round(
+                current_data, self.key[i], inverse=False, out=buffers[i % 2]
+            )
         
         return current_data
     
-    def _decrypt_multi_round(self, data: np.ndarray) -> np.ndarray:
+    def _decrypt_multi_round(self, data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Decrypt using Multi-Round Mode
         
         Args:
             data: Encrypted data
+            out: Optional array to store the result in (must not overlap data)
             
         Returns:
             Decrypted data
         """
-        current_data = data.copy()
+        # Alternate between two buffers instead of allocating one per round,
+        # arranged so the last round (round 0) writes into out
+        output = np.empty_like(data) if out is None else out
+        buffers = (output, np.empty_like(data))
+        current_data = data
         
         # Apply inverse rounds in reverse order
         for i in range(self.n - 1, -1, -1):
-            current_data = self._transform_round(current_data, self.key[i], inverse=True)
+            current_data = self._transform_round(
+                current_data, self.key[i], inverse=True, out=buffers[i % 2]
+            )
         
         return current_data
     
@@ -219,12 +481,34 @@ class SineScrambleCipher:
         segment_data, key_component, inverse = args
         return self._transform_round(segment_data, key_component, inverse=inverse)
     
-    def _encrypt_segmented(self, data: np.ndarray) -> np.ndarray:
+    def _segments_run_serially(self, data_size: int) -> bool:
+        """Check whether Segmented Mode gains nothing from worker threads for data_size bytes"""
+        return data_size < PARALLEL_SEGMENT_THRESHOLD or self.n == 1 or (os.cpu_count() or 1) == 1
+    
+    def _map_segments(self, segment_args: List[Tuple[np.ndarray, float, bool]], data_size: int) -> List[np.ndarray]:
+        """
+        Process all segments, in parallel on the shared pool when worthwhile
+        
+        Args:
+            segment_args: One (segment_data, key_component, inverse) tuple per segment
+            data_size: Total size of the data being processed
+            
+        Returns:
+            Processed segments, in order
+        """
+        if self._segments_run_serially(data_size):
+            return [self._process_segment(args) for args in segment_args]
+        
+        # Process segments in parallel
+        return list(_get_segment_pool().map(self._process_segment, segment_args))
+    
+    def _encrypt_segmented(self, data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Encrypt using Segmented Mode
         
         Args:
             data: Plaintext data
+            out: Optional array to store the result in (must not overlap data)
             
         Returns:
             Encrypted data
@@ -235,6 +519,10 @@ class SineScrambleCipher:
         if segment_size == 0:
             raise ValueError(f"Data too small for {self.n} segments")
         
+        if self._segments_run_serially(data_size):
+            # One gather and XOR over the whole input instead of a call per segment
+            return self._apply_tables(data, self._get_segmented_tables(data_size), inverse=False, out=out)
+        
         segments = []
         
         # Prepare segments and arguments for parallel processing
@@ -249,19 +537,18 @@ class SineScrambleCipher:
             segment = data[start_idx:end_idx]
             segment_args.append((segment, self.key[i], False))
         
-        # Process segments in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.n) as executor:
-            processed_segments = list(executor.map(self._process_segment, segment_args))
+        processed_segments = self._map_segments(segment_args, data_size)
         
         # Concatenate processed segments
-        return np.concatenate(processed_segments)
+        return np.concatenate(processed_segments, out=out)
     
-    def _decrypt_segmented(self, data: np.ndarray) -> np.ndarray:
+    def _decrypt_segmented(self, data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Decrypt using Segmented Mode
         
         Args:
             data: Encrypted data
+            out: Optional array to store the result in (must not overlap data)
             
         Returns:
             Decrypted data
@@ -272,6 +559,10 @@ class SineScrambleCipher:
         if segment_size == 0:
             raise ValueError(f"Data too small for {self.n} segments")
         
+        if self._segments_run_serially(data_size):
+            # One gather and XOR over the whole input instead of a call per segment
+            return self._apply_tables(data, self._get_segmented_tables(data_size), inverse=True, out=out)
+        
         # Prepare segments and arguments for parallel processing
         segment_args = []
         for i in range(self.n):
@@ -284,40 +575,129 @@ class SineScrambleCipher:
             segment = data[start_idx:end_idx]
             segment_args.append((segment, self.key[i], True))
         
-        # Process segments in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.n) as executor:
-            processed_segments = list(executor.map(self._process_segment, segment_args))
+        processed_segments = self._map_segments(segment_args, data_size)
         
         # Concatenate processed segments
-        return np.concatenate(processed_segments)
+        return np.concatenate(processed_segments, out=out)
     
-    def encrypt(self, data: Union[bytes, bytearray, str]) -> bytes:
+    def _message_round_tables(self, data_size: int) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
         """
-        Encrypt data using the configured mode
+        Get the tables of each round applied to a data_size-byte message, in encryption order
         
         Args:
-            data: Data to encrypt (bytes, bytearray, or string)
+            data_size: Size of the message
             
         Returns:
-            Encrypted data as bytes
+            One tuple of tables per round, laid out like those of _get_round_tables
         """
-        # Convert input to numpy array
-        if isinstance(data, str):
-            data_bytes = data.encode('utf-8')
+        if self.mode == OperationMode.MULTI_ROUND:
+            return [self._get_round_tables(key_component, data_size) for key_component in self.key]
+        elif self.mode == OperationMode.SEGMENTED:
+            if data_size // self.n == 0:
+                raise ValueError(f"Data too small for {self.n} segments")
+            return [self._get_segmented_tables(data_size)]
         else:
-            data_bytes = bytes(data)
+            raise ValueError(f"Unsupported operation mode: {self.mode}")
+    
+    def _transform_batch(self, messages: List[bytes], inverse: bool) -> List[bytes]:
+        """
+        Encrypt (or decrypt when inverse) many messages, grouped by size
+        
+        Messages of the same size share their round tables, so each group is
+        stacked into one (messages, size) array and every round is a single
+        gather and XOR over the whole group.
+        
+        Args:
+            messages: Messages to transform
+            inverse: If True, decrypt
+            
+        Returns:
+            Transformed messages, in order
+        """
+        positions_by_size = {}
+        for position, message in enumerate(messages):
+            positions_by_size.setdefault(len(message), []).append(position)
         
-        data_array = np.frombuffer(data_bytes, dtype=np.uint8)
+        results = [None] * len(messages)
+        for size, positions in positions_by_size.items():
+            round_tables = self._message_round_tables(size)
+            if inverse:
+                round_tables = round_tables[::-1]
+            
+            current_data = np.frombuffer(
+                b"".join([messages[position] for position in positions]), dtype=np.uint8
+            ).reshape(len(positions), size)
+            buffers = (np.empty_like(current_data), np.empty_like(current_data))
+            for i, tables in enumerate(round_tables):
+                current_data = self._apply_tables(current_data, tables, inverse=inverse, out=buffers[i % 2])
+            
+            group_result = current_data.tobytes()
+            for row, position in enumerate(positions):
+                results[position] = group_result[row * size:(row + 1) * size]
+        return results
+    
+    def encrypt_batch(self, messages: List[Union[bytes, bytearray, str]]) -> List[bytes]:
+        """
+        Encrypt many messages, processing messages of the same size together
+        
+        Gives the same ciphertexts as encrypting each message separately, but
+        each round is applied to all messages of the same size at once, which
+        saves the per-call overhead when there are many small messages.
         
-        # Encrypt based on mode
+        Args:
+            messages: Messages to encrypt (bytes, bytearray, or string)
+            
+        Returns:
+            Encrypted messages as bytes, in order
+        """
+        return self._transform_batch(
+            [message.encode('utf-8') if isinstance(message, str) else bytes(message) for message in messages],
+            inverse=False
+        )
+    
+    def decrypt_batch(self, messages: List[bytes]) -> List[bytes]:
+        """
+        Decrypt many messages, processing messages of the same size together
+        
+        Args:
+            messages: Encrypted messages as bytes
+            
+        Returns:
+            Decrypted messages as bytes, in order
+        """
+        return self._transform_batch([bytes(message) for message in messages], inverse=True)
+    
+    def _encrypt_array(self, data_array: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Encrypt a uint8 array with the configured mode, into out if given"""
+        if self.mode == OperationMode.MULTI_ROUND:
+            return self._encrypt_multi_round(data_array, out=out)
+        elif self.mode == OperationMode.SEGMENTED:
+            return self._encrypt_segmented(data_array, out=out)
+        else:
+            raise ValueError(f"Unsupported operation mode: {self.mode}")
+    
+    def _decrypt_array(self, data_array: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Decrypt a uint8 array with the configured mode, into out if given"""
         if self.mode == OperationMode.MULTI_ROUND:
-            encrypted_array = self._encrypt_multi_round(data_array)
+            return self._decrypt_multi_round(data_array, out=out)
         elif self.mode == OperationMode.SEGMENTED:
-            encrypted_array = self._encrypt_segmented(data_array)
+            return self._decrypt_segmented(data_array, out=out)
         else:
             raise ValueError(f"Unsupported operation mode: {self.mode}")
+    
+    def encrypt(self, data: Union[bytes, bytearray, memoryview, str]) -> bytes:
+        """
+        Encrypt data using the configured mode
         
-        return encrypted_array.tobytes()
+        Args:
+            data: Data to encrypt (string, or any bytes-like object, viewed without copying)
+            
+        Returns:
+            Encrypted data as bytes
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return self._encrypt_array(_as_byte_array(data)).tobytes()
     
     def decrypt(self, data: bytes) -> bytes:
         """
@@ -329,17 +709,42 @@ class SineScrambleCipher:
         Returns:
             Decrypted data as bytes
         """
-        data_array = np.frombuffer(data, dtype=np.uint8)
+        return self._decrypt_array(np.frombuffer(data, dtype=np.uint8)).tobytes()
+    
+    def encrypt_into(self, data: Union[bytes, bytearray, memoryview, str], out: Union[bytearray, memoryview]) -> int:
+        """
+        Encrypt data straight into a writable buffer of the same length
         
-        # Decrypt based on mode
-        if self.mode == OperationMode.MULTI_ROUND:
-            decrypted_array = self._decrypt_multi_round(data_array)
-        elif self.mode == OperationMode.SEGMENTED:
-            decrypted_array = self._decrypt_segmented(data_array)
-        else:
-            raise ValueError(f"Unsupported operation mode: {self.mode}")
+        Lets repeated calls reuse one output buffer instead of allocating a
+        new bytes object each time.
         
-        return decrypted_array.tobytes()
+        Args:
+            data: Data to encrypt (string, or any bytes-like object)
+            out: Writable buffer (e.g. a bytearray) of len(data) bytes
+            
+        Returns:
+            Number of bytes written
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        data_array, out_array = _as_input_and_output_arrays(data, out)
+        self._encrypt_array(data_array, out=out_array)
+        return len(data_array)
+    
+    def decrypt_into(self, data: Union[bytes, bytearray, memoryview], out: Union[bytearray, memoryview]) -> int:
+        """
+        Decrypt data straight into a writable buffer of the same length
+        
+        Args:
+            data: Encrypted data (any bytes-like object)
+            out: Writable buffer (e.g. a bytearray) of len(data) bytes
+            
+        Returns:
+            Number of bytes written
+        """
+        data_array, out_array = _as_input_and_output_arrays(data, out)
+        self._decrypt_array(data_array, out=out_array)
+        return len(data_array)
     
     def encrypt_file(self, input_path: str, output_path: str) -> None:
         """
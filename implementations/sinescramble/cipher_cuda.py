@@ -0,0 +1,84 @@
+"""
+CUDA SineScramble Kernels
+
+Optional GPU offload for TurboSineScrambleCipher. Only the bandwidth-bound
+permute/XOR stage runs on the device, from round tables kept in GPU memory:
+the scores, permutations and substitution bits are still computed on the CPU,
+since the device sin differs from the host libm in the last ulp and would
+change the ciphertexts.
+"""
+
+import numpy as np
+
+try:
+    from numba import cuda
+except ImportError:
+    cuda = None
+
+
+# Smallest input size (in bytes) whose precomputed tables are moved to the GPU
+CUDA_MIN_SIZE = 1_000_000
+
+_THREADS_PER_BLOCK = 256
+
+
+def cuda_available():
+    """Check whether a CUDA device can be used"""
+    if cuda is None:
+        return False
+    try:
+        return cuda.is_available()
+    except Exception:
+        return False
+
+
+if cuda is not None:
+    @cuda.jit
+    def _permute_xor_kernel(data, permutation_map, substitution_values, result):
+        """Forward round: gather through the permutation, then XOR"""
+        i = cuda.grid(1)
+        if i < data.shape[0]:
+            result[i] = data[permutation_map[i]] ^ substitution_values[i]
+
+    @cuda.jit
+    def _inverse_permute_xor_kernel(data, permutation_map, substitution_values, result):
+        """Inverse round: XOR, then scatter back through the permutation"""
+        i = cuda.grid(1)
+        if i < data.shape[0]:
+            result[permutation_map[i]] = data[i] ^ substitution_values[i]
+
+
+class CudaRoundTables:
+    """
+    Precomputed round tables resident in GPU memory
+
+    Holds the (rounds, data_size) permutation and substitution tables built by
+    TurboSineScrambleCipher.precompute, so each encrypt/decrypt only copies the
+    data to the device, runs one gather/XOR kernel per round and copies the
+    result back.
+    """
+
+    def __init__(self, permutation_maps, substitution_values):
+        """Copy the tables to the device"""
+        self.rounds, self.data_size = permutation_maps.shape
+        self._permutation_maps = cuda.to_device(np.ascontiguousarray(permutation_maps))
+        self._substitution_values = cuda.to_device(np.ascontiguousarray(substitution_values))
+
+    def apply(self, data, inverse=False, out=None):
+        """Apply the rounds to data (in reverse order when inverse), into out if given"""
+        stream = cuda.stream()
+        current_data = cuda.to_device(data, stream=stream)
+        result = cuda.device_array_like(current_data, stream=stream)
+        blocks = (self.data_size + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+        kernel = _inverse_permute_xor_kernel if inverse else _permute_xor_kernel
+
+        for r in range(self.rounds):
+            row = self.rounds - 1 - r if inverse else r
+            kernel[blocks, _THREADS_PER_BLOCK, stream](
+                current_data, self._permutation_maps[row], self._substitution_values[row], result
+            )
+            current_data, result = result, current_data
+
+        output = current_data.copy_to_host(ary=out, stream=stream)
+        stream.synchronize()
+        return output
@@ -56,11 +56,12 @@ def _generate_substitution_mask_jit(key_component: float, data_size: int,
 def _permute_data_jit(data: np.ndarray, permutation_map: np.ndarray, inverse: bool = False) -> np.ndarray:
     """JIT-compiled data permutation"""
     if inverse:
-        # Create inverse permutation in-place
-        inverse_map = np.empty(len(permutation_map), dtype=np.int64)
+        # Scatter each element back to where the permutation took it from,
+        # without materializing the inverse map
+        result = np.empty_like(data)
         for i in range(len(permutation_map)):
-            inverse_map[permutation_map[i]] = i
-        return data[inverse_map]
+            result[permutation_map[i]] = data[i]
+        return result
     else:
         return data[permutation_map]
 
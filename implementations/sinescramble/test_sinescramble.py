@@ -7,10 +7,17 @@ SineScramble cipher implementations: Original, Optimized, and Turbo.
 
 import time
 import os
+import sys
+import contextlib
 import tempfile
 import gc
-import psutil
-from typing import List, Dict, Tuple
+import hashlib
+import tracemalloc
+import statistics
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Dict, Tuple, Iterable
 import numpy as np
 
 try:
@@ -35,6 +42,279 @@ except ImportError:
     )
 
 
+# Thread switch interval (seconds) while timing; long enough that no switch
+# is requested inside a timed run
+_BENCH_SWITCH_INTERVAL = 1.0
+
+_NO_TURBO_PATH = '/sys/devices/system/cpu/intel_pstate/no_turbo'
+
+# Seed of the benchmark and stress test data, so every run encrypts the same bytes
+_TEST_DATA_SEED = 2024
+
+# Variants whose kernels run Numba prange threads in every mode
+_THREADED_VARIANTS = {'Turbo'}
+
+
+@contextlib.contextmanager
+def _bench_env():
+    """
+    Quiet the interpreter around a timed region
+    
+    Collects and then disables the garbage collector and raises the thread
+    switch interval, restoring both on exit. CPU affinity is left alone: the
+    Numba variants and segmented mode run their own threads, which pinning to
+    one core would serialize.
+    """
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(_BENCH_SWITCH_INTERVAL)
+    try:
+        yield
+    finally:
+        sys.setswitchinterval(switch_interval)
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _test_bytes(size, seed=_TEST_DATA_SEED):
+    """Reproducible pseudo-random test data (seeded NumPy generator, not for keys)"""
+    return np.random.default_rng(seed).bytes(size)
+
+
+def _warn_if_turbo_boost():
+    """Warn when Intel Turbo Boost is enabled, since it makes timings depend on temperature"""
+    try:
+        with open(_NO_TURBO_PATH) as f:
+            no_turbo = f.read().strip()
+    except OSError:
+        return
+    if no_turbo == '0':
+        print(f"⚠ Turbo Boost is enabled; timings may drift (write 1 to {_NO_TURBO_PATH} to disable)")
+
+
+@contextlib.contextmanager
+def _trace_memory():
+    """
+    Trace Python and NumPy allocations for the duration of the block
+    
+    Yields a dict filled on exit with 'traced_peak' (high-water mark) and
+    'traced_current' (still allocated after a collection, so > 0 means
+    something was kept) in MB, both relative to the start of the block.
+    Tracing started by the caller is left running.
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    gc.collect()
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    stats = {}
+    try:
+        yield stats
+    finally:
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+        if not was_tracing:
+            tracemalloc.stop()
+        stats['traced_peak'] = (peak - start) / (1024 * 1024)
+        stats['traced_current'] = (current - start) / (1024 * 1024)
+
+
+def _trace_round_trip(cipher, data, enc_buf, dec_buf):
+    """
+    Run one untimed round trip under _trace_memory
+    
+    Kept apart from the timed runs, since tracing slows every allocation.
+    
+    Returns:
+        The _trace_memory stats of the round trip
+    """
+    with _trace_memory() as traced:
+        _decrypt_into(cipher, _encrypt_into(cipher, data, enc_buf), dec_buf)
+    return traced
+
+
+def _measure(fn, data, min_time=0.1, warmup=2, reps=5):
+    """
+    Time fn(data) in steady state
+    
+    Calls fn warmup times first (JIT compilation, cached tables), then takes
+    reps timed runs inside _bench_env. Each run repeats the
+    call until it lasts at least min_time seconds, so small inputs are not
+    lost in timer resolution.
+    
+    Returns:
+        (result of the last call, median seconds per call)
+    """
+    result = None
+    for _ in range(warmup):
+        result = fn(data)
+    
+    start = time.perf_counter_ns()
+    result = fn(data)
+    calls_per_run = max(1, int(min_time * 1e9) // max(time.perf_counter_ns() - start, 1))
+    
+    times = []
+    with _bench_env():
+        for _ in range(reps):
+            start = time.perf_counter_ns()
+            for _ in range(calls_per_run):
+                result = fn(data)
+            times.append((time.perf_counter_ns() - start) / calls_per_run)
+    
+    return result, statistics.median(times) / 1e9
+
+
+def _digest(data):
+    """Short BLAKE2 digest used to check round trips without holding a second copy of the input"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _encrypt_into(cipher, data, out):
+    """Encrypt data into the preallocated out where the cipher supports it, returning the ciphertext"""
+    if hasattr(cipher, 'encrypt_into'):
+        cipher.encrypt_into(data, out)
+        return out
+    return cipher.encrypt(data)
+
+
+def _decrypt_into(cipher, data, out):
+    """Decrypt data into the preallocated out where the cipher supports it, returning the plaintext"""
+    if hasattr(cipher, 'decrypt_into'):
+        cipher.decrypt_into(data, out)
+        return out
+    return cipher.decrypt(data)
+
+
+@dataclass(frozen=True)
+class BenchCell:
+    """One (variant, mode, size) point of a benchmark sweep"""
+    variant: str
+    mode: OperationMode
+    size: int
+
+
+def cells(variants, modes, sizes) -> Iterable[BenchCell]:
+    """Generate the cells of a variants x modes x sizes sweep, sizes varying fastest"""
+    for variant in variants:
+        for mode in modes:
+            for size in sizes:
+                yield BenchCell(variant, mode, size)
+
+
+# Ciphers built by _bench_cell, by (cipher class, mode, key), in each process
+_bench_ciphers = {}
+
+
+def _bench_cell(cipher_class, mode, key, test_data):
+    """
+    Benchmark one (variant, mode, size) cell
+    
+    Top-level so it can run in a worker process. The cipher is reused across
+    the sizes of a sweep that land in the same process.
+    
+    Returns:
+        (encrypt seconds, decrypt seconds, round trip correct)
+    """
+    cache_key = (cipher_class, mode, tuple(key))
+    cipher = _bench_ciphers.get(cache_key)
+    if cipher is None:
+        cipher = _bench_ciphers[cache_key] = cipher_class(key, mode)
+    encrypted, encrypt_time = _measure(cipher.encrypt, test_data)
+    decrypted, decrypt_time = _measure(cipher.decrypt, encrypted)
+    return encrypt_time, decrypt_time, test_data == decrypted
+
+
+def _pin_worker(next_core, cores):
+    """Pin this worker process to the next free CPU core"""
+    with next_core.get_lock():
+        index = next_core.value
+        next_core.value += 1
+    os.sched_setaffinity(0, {cores[index % len(cores)]})
+
+
+def _run_cells(sweep, variants, key, random_data, measure_fn=_bench_cell):
+    """
+    Run measure_fn for each BenchCell of a sweep
+    
+    measure_fn is called as measure_fn(cipher_class, mode, key, test_data),
+    with the class looked up by name in variants and test_data a size-byte
+    prefix of random_data; it must be a top-level function so it can run in
+    a worker process. Single-threaded cells are spread over one worker
+    process per physical core, each pinned to its own core where the platform
+    supports it. Cells that run threads of their own (see _runs_threads) are
+    then run one at a time in this process, unpinned, so they get every core
+    and nothing else competes with them, as in an unparallelized sweep. With a
+    single physical core every cell runs in this process. Workers are spawned
+    rather than forked, since forking after Numba's parallel threads have
+    started leaves this process hanging at exit.
+    
+    Returns:
+        Dict mapping each cell to its measure_fn result, or to the exception
+        it raised
+    """
+    import psutil
+    
+    _warn_if_turbo_boost()
+    sweep = list(sweep)
+    workers = min(psutil.cpu_count(logical=False) or 1, len(sweep))
+    if workers <= 1:
+        return _run_cells_here(sweep, variants, key, random_data, measure_fn)
+    
+    pooled = [cell for cell in sweep if not _runs_threads(cell)]
+    outcomes = _run_cells_pooled(pooled, variants, key, random_data, measure_fn,
+                                 min(workers, len(pooled)))
+    outcomes.update(_run_cells_here(
+        [cell for cell in sweep if _runs_threads(cell)], variants, key, random_data, measure_fn
+    ))
+    return outcomes
+
+
+def _runs_threads(cell):
+    """Whether a cell's cipher runs threads of its own (segmented mode, or Numba prange kernels)"""
+    return cell.mode == OperationMode.SEGMENTED or cell.variant in _THREADED_VARIANTS
+
+
+def _run_cells_here(sweep, variants, key, random_data, measure_fn):
+    """Run the cells of a sweep one at a time in this process, as _run_cells does"""
+    outcomes = {}
+    for cell in sweep:
+        try:
+            outcomes[cell] = measure_fn(variants[cell.variant], cell.mode, key, random_data[:cell.size])
+        except Exception as e:
+            outcomes[cell] = e
+    return outcomes
+
+
+def _run_cells_pooled(sweep, variants, key, random_data, measure_fn, workers):
+    """Run the cells of a sweep in pinned worker processes, as _run_cells does"""
+    if workers <= 1:
+        return _run_cells_here(sweep, variants, key, random_data, measure_fn)
+    
+    context = multiprocessing.get_context('spawn')
+    initializer, initargs = None, ()
+    if hasattr(os, 'sched_setaffinity'):
+        initializer = _pin_worker
+        initargs = (context.Value('i', 0), sorted(os.sched_getaffinity(0)))
+    
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=initializer, initargs=initargs) as executor:
+        futures = {
+            cell: executor.submit(measure_fn, variants[cell.variant], cell.mode, key,
+                                  random_data[:cell.size])
+            for cell in sweep
+        }
+        outcomes = {}
+        for cell, future in futures.items():
+            try:
+                outcomes[cell] = future.result()
+            except Exception as e:
+                outcomes[cell] = e
+        return outcomes
+
+
 class VariantComparison:
     """Comprehensive comparison of all three cipher variants"""
     
@@ -45,6 +325,15 @@ class VariantComparison:
             'Turbo': TurboSineScrambleCipher
         }
         self.results = {}
+        self._cipher_cache = {}
+    
+    def _get_cipher(self, variant_name, mode, key):
+        """Get the cipher for (variant, mode, key), created once per instance"""
+        cache_key = (variant_name, mode, tuple(key))
+        cipher = self._cipher_cache.get(cache_key)
+        if cipher is None:
+            cipher = self._cipher_cache[cache_key] = self.variants[variant_name](key, mode)
+        return cipher
     
     def test_correctness_all_variants(self):
         """Test correctness across all variants"""
@@ -90,6 +379,16 @@ class VariantComparison:
         key = generate_random_key(6, seed=123)
         test_sizes = [1024, 10240, 102400, 1048576]  # 1KB, 10KB, 100KB, 1MB
         
+        modes = [OperationMode.MULTI_ROUND, OperationMode.SEGMENTED]
+        
+        # Generate test data once; each size uses a prefix of it
+        random_data = _test_bytes(max(test_sizes))
+        
+        # Run every cell up front (in parallel where there are cores for it)
+        outcomes = _run_cells(
+            cells(self.variants, modes, test_sizes), self.variants, key, random_data
+        )
+        
         results = {}
         
         for variant_name, cipher_class in self.variants.items():
@@ -98,45 +397,19 @@ class VariantComparison:
             try:
                 variant_results = {}
                 
-                for mode in [OperationMode.MULTI_ROUND, OperationMode.SEGMENTED]:
+                for mode in modes:
                     mode_results = {}
                     
                     for size in test_sizes:
-                        # Generate test data
-                        test_data = os.urandom(size)
-                        
-                        # Create cipher
-                        cipher = cipher_class(key, mode)
-                        
-                        # Warm up (especially for JIT-compiled variants)
-                        if size >= 1024:
-                            warm_data = test_data[:1024]
-                            try:
-                                cipher.encrypt(warm_data)
-                                cipher.decrypt(cipher.encrypt(warm_data))
-                            except:
-                                pass
-                        
-                        # Force garbage collection
-                        gc.collect()
-                        
-                        # Benchmark encryption
-                        start = time.perf_counter()
-                        encrypted = cipher.encrypt(test_data)
-                        encrypt_time = time.perf_counter() - start
-                        
-                        # Benchmark decryption
-                        start = time.perf_counter()
-                        decrypted = cipher.decrypt(encrypted)
-                        decrypt_time = time.perf_counter() - start
+                        outcome = outcomes[BenchCell(variant_name, mode, size)]
+                        if isinstance(outcome, Exception):
+                            raise outcome
+                        encrypt_time, decrypt_time, correct = outcome
                         
                         # Calculate throughput
                         encrypt_mbps = (size / (1024 * 1024)) / encrypt_time
                         decrypt_mbps = (size / (1024 * 1024)) / decrypt_time
                         
-                        # Verify correctness
-                        correct = test_data == decrypted
-                        
                         mode_results[size] = {
                             'encrypt_time': encrypt_time,
                             'decrypt_time': decrypt_time,
@@ -160,10 +433,12 @@ class VariantComparison:
     
     def stress_test_stability(self):
         """Stress test for stability and memory usage"""
+        import psutil
+        
         print("\n=== Stability Stress Test - All Variants ===")
         
         key = generate_random_key(4, seed=456)
-        test_data = os.urandom(1024 * 1024)  # 1MB
+        test_data = _test_bytes(1024 * 1024)  # 1MB
         iterations = 50
         
         results = {}
@@ -173,12 +448,19 @@ class VariantComparison:
             print(f"\n--- Stress Testing {variant_name} ---")
             
             try:
-                # Measure memory before
+                # Output buffers reused by every iteration
+                enc_buf = bytearray(len(test_data))
+                dec_buf = bytearray(len(test_data))
+                
+                # Measure memory before (RSS also sees Numba and other native allocations)
                 gc.collect()
                 mem_before = process.memory_info().rss / (1024 * 1024)
                 
-                # Create cipher
-                cipher = cipher_class(key, OperationMode.SEGMENTED)
+                # Get cipher
+                cipher = self._get_cipher(variant_name, OperationMode.SEGMENTED, key)
+                
+                # Trace the allocations of a first round trip, outside the timed loop
+                traced = _trace_round_trip(cipher, test_data, enc_buf, dec_buf)
                 
                 # Run stress test
                 start_time = time.perf_counter()
@@ -186,8 +468,8 @@ class VariantComparison:
                 
                 for i in range(iterations):
                     try:
-                        encrypted = cipher.encrypt(test_data)
-                        decrypted = cipher.decrypt(encrypted)
+                        encrypted = _encrypt_into(cipher, test_data, enc_buf)
+                        decrypted = _decrypt_into(cipher, encrypted, dec_buf)
                         
                         if test_data != decrypted:
                             errors += 1
@@ -214,13 +496,16 @@ class VariantComparison:
                     'memory_before': mem_before,
                     'memory_after': mem_after,
                     'memory_growth': mem_after - mem_before,
+                    'traced_peak': traced['traced_peak'],
+                    'traced_current': traced['traced_current'],
                     'avg_time_per_iteration': total_time / iterations
                 }
                 
                 print(f"  Total time: {total_time:.2f}s")
                 print(f"  Errors: {errors}/{iterations}")
                 print(f"  Success rate: {results[variant_name]['success_rate']:.1f}%")
-                print(f"  Memory growth: {results[variant_name]['memory_growth']:.1f} MB")
+                print(f"  Traced memory: {traced['traced_peak']:.1f} MB peak, {traced['traced_current']:.1f} MB retained")
+                print(f"  RSS growth: {results[variant_name]['memory_growth']:.1f} MB")
                 
             except Exception as e:
                 print(f"  ✗ ERROR: {e}")
@@ -230,6 +515,8 @@ class VariantComparison:
     
     def test_large_data_handling(self):
         """Test handling of large data sets"""
+        import psutil
+        
         print("\n=== Large Data Handling Test - All Variants ===")
         
         key = generate_random_key(4, seed=789)
@@ -238,6 +525,9 @@ class VariantComparison:
             50 * 1024 * 1024,   # 50MB
         ]
         
+        # Generate test data once; each size uses a prefix of it
+        random_data = _test_bytes(max(large_sizes))
+        
         results = {}
         
         for variant_name, cipher_class in self.variants.items():
@@ -246,30 +536,41 @@ class VariantComparison:
             try:
                 variant_results = {}
                 
+                # Get cipher (shared by all sizes)
+                cipher = self._get_cipher(variant_name, OperationMode.SEGMENTED, key)
+                
                 for size in large_sizes:
                     mb_size = size // (1024 * 1024)
                     print(f"  Testing {mb_size}MB...")
                     
-                    # Generate large test data
-                    test_data = os.urandom(size)
+                    # Zero-copy view of the input, checked by digest after the round trip
+                    test_data = memoryview(random_data)[:size]
+                    expected_digest = _digest(test_data)
                     
-                    # Create cipher
-                    cipher = cipher_class(key, OperationMode.SEGMENTED)
+                    # Whole-message buffers: every round permutes across the full
+                    # input, so the round trip cannot be streamed in chunks
+                    enc_buf = bytearray(size)
+                    dec_buf = bytearray(size)
                     
                     # Measure memory before
                     gc.collect()
                     mem_before = psutil.Process().memory_info().rss / (1024 * 1024)
                     
                     try:
+                        # Trace the allocations of a first round trip, outside the timed runs
+                        traced = _trace_round_trip(cipher, test_data, enc_buf, dec_buf)
+                        
                         # Encrypt
-                        start = time.perf_counter()
-                        encrypted = cipher.encrypt(test_data)
-                        encrypt_time = time.perf_counter() - start
+                        with _bench_env():
+                            start = time.perf_counter()
+                            encrypted = _encrypt_into(cipher, test_data, enc_buf)
+                            encrypt_time = time.perf_counter() - start
                         
                         # Decrypt
-                        start = time.perf_counter()
-                        decrypted = cipher.decrypt(encrypted)
-                        decrypt_time = time.perf_counter() - start
+                        with _bench_env():
+                            start = time.perf_counter()
+                            decrypted = _decrypt_into(cipher, encrypted, dec_buf)
+                            decrypt_time = time.perf_counter() - start
                         
                         # Measure memory after
                         gc.collect()
@@ -278,7 +579,7 @@ class VariantComparison:
                         # Calculate metrics
                         encrypt_mbps = mb_size / encrypt_time
                         decrypt_mbps = mb_size / decrypt_time
-                        correct = test_data == decrypted
+                        correct = _digest(decrypted) == expected_digest
                         
                         variant_results[mb_size] = {
                             'encrypt_time': encrypt_time,
@@ -288,13 +589,16 @@ class VariantComparison:
                             'correct': correct,
                             'memory_before': mem_before,
                             'memory_after': mem_after,
-                            'memory_growth': mem_after - mem_before
+                            'memory_growth': mem_after - mem_before,
+                            'traced_peak': traced['traced_peak'],
+                            'traced_current': traced['traced_current']
                         }
                         
                         print(f"    Encrypt: {encrypt_time:.2f}s → {encrypt_mbps:.1f} MB/s")
                         print(f"    Decrypt: {decrypt_time:.2f}s → {decrypt_mbps:.1f} MB/s")
                         print(f"    Correct: {correct}")
-                        print(f"    Memory growth: {mem_after - mem_before:.1f} MB")
+                        print(f"    Traced memory: {traced['traced_peak']:.1f} MB peak, {traced['traced_current']:.1f} MB retained")
+                        print(f"    RSS growth: {mem_after - mem_before:.1f} MB")
                         
                     except Exception as e:
                         print(f"    ✗ ERROR: {e}")
@@ -421,6 +725,102 @@ def test_basic_encryption_decryption():
     return test_message == decrypted_mr.decode('utf-8') and test_message == decrypted_seg.decode('utf-8')
 
 
+def test_turbo_precompute():
+    """Test that Turbo's precomputed tables give the same results as the normal path"""
+    print("\n=== Turbo Precompute Test ===")
+
+    key = generate_random_key(5, seed=42)
+    test_data = _test_bytes(4096)
+    other_data = test_data[:1000]
+
+    for mode in (OperationMode.MULTI_ROUND, OperationMode.SEGMENTED):
+        reference = TurboSineScrambleCipher(key, mode)
+        cipher = TurboSineScrambleCipher(key, mode)
+        cipher.precompute(len(test_data))
+
+        encrypted = cipher.encrypt(test_data)
+        assert encrypted == reference.encrypt(test_data), f"{mode.value}: precomputed ciphertext differs"
+        assert cipher.decrypt(encrypted) == test_data, f"{mode.value}: precomputed round trip failed"
+
+        # Other sizes take the normal path
+        other_encrypted = cipher.encrypt(other_data)
+        assert other_encrypted == reference.encrypt(other_data), f"{mode.value}: other-size ciphertext differs"
+        assert cipher.decrypt(other_encrypted) == other_data, f"{mode.value}: other-size round trip failed"
+
+        print(f"{mode.value}: ✓ precomputed and normal paths agree")
+
+
+def test_batch_encryption():
+    """Test that encrypt_batch/decrypt_batch match per-message encryption"""
+    print("\n=== Batch Encryption Test ===")
+
+    key = generate_random_key(5, seed=42)
+    test_data = _test_bytes(256)
+    # Mixed lengths, with repeated sizes so some messages are grouped together
+    messages = [test_data[:16], test_data[16:80], test_data[80:96], test_data[96:256], "Batched text message"]
+
+    for mode in (OperationMode.MULTI_ROUND, OperationMode.SEGMENTED):
+        cipher = SineScrambleCipher(key, mode)
+
+        encrypted = cipher.encrypt_batch(messages)
+        assert encrypted == [cipher.encrypt(message) for message in messages], f"{mode.value}: batch ciphertext differs"
+        decrypted = cipher.decrypt_batch(encrypted)
+        assert decrypted[:-1] == messages[:-1], f"{mode.value}: batch round trip failed"
+        assert decrypted[-1].decode('utf-8') == messages[-1], f"{mode.value}: batch round trip failed"
+        assert cipher.encrypt_batch([]) == [], f"{mode.value}: empty batch not empty"
+
+        print(f"{mode.value}: ✓ batch matches per-message encryption")
+
+    # Segmented Mode needs at least one byte per segment
+    cipher = SineScrambleCipher(key, OperationMode.SEGMENTED)
+    try:
+        cipher.encrypt_batch([test_data[:16], test_data[:len(key) - 1]])
+    except ValueError as e:
+        print(f"Too-short segmented message: ✓ rejected ({e})")
+    else:
+        raise AssertionError("Too-short segmented message was not rejected")
+
+
+def test_encrypt_into():
+    """Test encrypt_into/decrypt_into output buffer handling"""
+    print("\n=== Encrypt Into Buffer Test ===")
+
+    key = generate_random_key(5, seed=42)
+    test_data = _test_bytes(512)
+    text = "Text written straight into a buffer: αβγ"
+
+    for cipher_class in (SineScrambleCipher, TurboSineScrambleCipher):
+        cipher = cipher_class(key, OperationMode.MULTI_ROUND)
+        name = cipher_class.__name__
+
+        # Wrong-length and read-only output buffers are rejected
+        for out, error in ((bytearray(len(test_data) - 1), ValueError), (bytes(len(test_data)), TypeError)):
+            try:
+                cipher.encrypt_into(test_data, out)
+            except error:
+                pass
+            else:
+                raise AssertionError(f"{name}: {type(out).__name__} output of {len(out)} bytes not rejected")
+
+        # An output buffer that is also the input
+        buffer = bytearray(test_data)
+        cipher.encrypt_into(buffer, buffer)
+        assert bytes(buffer) == cipher.encrypt(test_data), f"{name}: aliased encrypt_into differs"
+        cipher.decrypt_into(buffer, buffer)
+        assert bytes(buffer) == test_data, f"{name}: aliased decrypt_into failed"
+
+        # str input is encoded as UTF-8
+        encoded = text.encode('utf-8')
+        buffer = bytearray(len(encoded))
+        assert cipher.encrypt_into(text, buffer) == len(encoded), f"{name}: wrong byte count for str input"
+        assert bytes(buffer) == cipher.encrypt(text), f"{name}: str encrypt_into differs"
+        decrypted = bytearray(len(encoded))
+        cipher.decrypt_into(buffer, decrypted)
+        assert decrypted.decode('utf-8') == text, f"{name}: str round trip failed"
+
+        print(f"{name}: ✓ output buffers checked")
+
+
 def test_key_management():
     """Test key generation and management utilities"""
     print("\n=== Key Management Test ===")
@@ -553,8 +953,13 @@ def test_avalanche_effect():
     encrypted1 = cipher.encrypt(message1)
     encrypted2 = cipher.encrypt(message2)
     
-    # Calculate bit difference
-    bit_diff = sum(bin(a ^ b).count('1') for a, b in zip(encrypted1, encrypted2))
+    # Calculate bit difference over the common length (popcount on NumPy 2, unpacked bits before)
+    common = min(len(encrypted1), len(encrypted2))
+    diff = np.frombuffer(encrypted1, dtype=np.uint8)[:common] ^ np.frombuffer(encrypted2, dtype=np.uint8)[:common]
+    if hasattr(np, 'bitwise_count'):
+        bit_diff = int(np.bitwise_count(diff).sum())
+    else:
+        bit_diff = int(np.count_nonzero(np.unpackbits(diff)))
     total_bits = len(encrypted1) * 8
     avalanche_ratio = bit_diff / total_bits
     
@@ -585,9 +990,6 @@ def test_use_case_recommendations():
 
 
 # === BEGIN: ComprehensivePerformanceTest from test_performance.py ===
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-
 class ComprehensivePerformanceTest:
     """Comprehensive performance testing for all three variants with visualization"""
     
@@ -600,6 +1002,15 @@ class ComprehensivePerformanceTest:
         self.results = {}
         self.stability_results = {}
         self.large_data_results = {}
+        self._cipher_cache = {}
+    
+    def _get_cipher(self, variant_name, mode, key):
+        """Get the cipher for (variant, mode, key), created once per instance"""
+        cache_key = (variant_name, mode, tuple(key))
+        cipher = self._cipher_cache.get(cache_key)
+        if cipher is None:
+            cipher = self._cipher_cache[cache_key] = self.variants[variant_name](key, mode)
+        return cipher
     
     def print_system_info(self):
         import psutil
@@ -626,7 +1037,20 @@ class ComprehensivePerformanceTest:
             10485760,      # 10MB
         ]
         
-        for mode in [OperationMode.SEGMENTED, OperationMode.MULTI_ROUND]:
+        modes = [OperationMode.SEGMENTED, OperationMode.MULTI_ROUND]
+        
+        # Generate test data once; each size uses a prefix of it
+        random_data = _test_bytes(max(test_sizes))
+        
+        # Run every cell up front (in parallel where there are cores for it),
+        # skipping sizes too small for segmented mode
+        outcomes = _run_cells(
+            [cell for cell in cells(self.variants, modes, test_sizes)
+             if not (cell.mode == OperationMode.SEGMENTED and cell.size < len(key))],
+            self.variants, key, random_data
+        )
+        
+        for mode in modes:
             print(f"\n🎯 {mode.value.upper()} MODE PERFORMANCE")
             print("-" * 70)
             print(f"{'Size':<8} {'Original':<12} {'Optimized':<12} {'Turbo':<12} {'Best':<8}")
@@ -639,47 +1063,20 @@ class ComprehensivePerformanceTest:
                 if mode == OperationMode.SEGMENTED and size < len(key):
                     continue
                 
-                # Generate test data
-                test_data = os.urandom(size)
-                
                 size_results = {}
                 
-                # Test each variant
+                # Collect each variant
                 for variant_name, cipher_class in self.variants.items():
                     try:
-                        # Create cipher
-                        cipher = cipher_class(key, mode)
-                        
-                        # Warm up JIT for optimized variants
-                        if 'optimized' in variant_name.lower() or 'turbo' in variant_name.lower():
-                            if size >= 1024:
-                                warm_data = test_data[:1024]
-                                try:
-                                    cipher.encrypt(warm_data)
-                                    cipher.decrypt(cipher.encrypt(warm_data))
-                                except:
-                                    pass
-                        
-                        # Force garbage collection
-                        gc.collect()
-                        
-                        # Benchmark encryption
-                        start = time.perf_counter()
-                        encrypted = cipher.encrypt(test_data)
-                        encrypt_time = time.perf_counter() - start
-                        
-                        # Benchmark decryption
-                        start = time.perf_counter()
-                        decrypted = cipher.decrypt(encrypted)
-                        decrypt_time = time.perf_counter() - start
+                        outcome = outcomes[BenchCell(variant_name, mode, size)]
+                        if isinstance(outcome, Exception):
+                            raise outcome
+                        encrypt_time, decrypt_time, correct = outcome
                         
                         # Calculate throughput
                         total_time = encrypt_time + decrypt_time
                         mbps = (size * 2) / (1024 * 1024) / total_time
                         
-                        # Verify correctness
-                        correct = test_data == decrypted
-                        
                         size_results[variant_name] = {
                             'mbps': mbps,
                             'encrypt_time': encrypt_time,
@@ -724,11 +1121,13 @@ class ComprehensivePerformanceTest:
     
     def stability_stress_test(self):
         """Stress test for stability across all variants"""
+        import psutil
+        
         print("\n💪 Stability Stress Test - All Variants")
         print("=" * 60)
         
         key = generate_random_key(4, seed=123)
-        test_data = os.urandom(1024 * 1024)  # 1MB
+        test_data = _test_bytes(1024 * 1024)  # 1MB
         iterations = 30
         
         results = {}
@@ -739,12 +1138,19 @@ class ComprehensivePerformanceTest:
             print("-" * 40)
             
             try:
+                # Output buffers reused by every iteration
+                enc_buf = bytearray(len(test_data))
+                dec_buf = bytearray(len(test_data))
+                
                 # Measure memory before
                 gc.collect()
                 mem_before = process.memory_info().rss / (1024 * 1024)
                 
-                # Create cipher
-                cipher = cipher_class(key, OperationMode.SEGMENTED)
+                # Get cipher
+                cipher = self._get_cipher(variant_name, OperationMode.SEGMENTED, key)
+                
+                # Trace the allocations of a first round trip, outside the timed loop
+                traced = _trace_round_trip(cipher, test_data, enc_buf, dec_buf)
                 
                 # Run stress test
                 start_time = time.perf_counter()
@@ -754,8 +1160,8 @@ class ComprehensivePerformanceTest:
                 for i in range(iterations):
                     try:
                         iter_start = time.perf_counter()
-                        encrypted = cipher.encrypt(test_data)
-                        decrypted = cipher.decrypt(encrypted)
+                        encrypted = _encrypt_into(cipher, test_data, enc_buf)
+                        decrypted = _decrypt_into(cipher, encrypted, dec_buf)
                         iter_time = time.perf_counter() - iter_start
                         
                         if test_data != decrypted:
@@ -791,6 +1197,8 @@ class ComprehensivePerformanceTest:
                     'memory_before': mem_before,
                     'memory_after': mem_after,
                     'memory_growth': mem_after - mem_before,
+                    'traced_peak': traced['traced_peak'],
+                    'traced_current': traced['traced_current'],
                     'avg_time': avg_time,
                     'min_time': min_time,
                     'max_time': max_time,
@@ -800,7 +1208,8 @@ class ComprehensivePerformanceTest:
                 print(f"  Total time: {total_time:.2f}s")
                 print(f"  Errors: {errors}/{iterations}")
                 print(f"  Success rate: {success_rate:.1f}%")
-                print(f"  Memory growth: {mem_after - mem_before:.1f} MB")
+                print(f"  Traced memory: {traced['traced_peak']:.1f} MB peak, {traced['traced_current']:.1f} MB retained")
+                print(f"  RSS growth: {mem_after - mem_before:.1f} MB")
                 print(f"  Avg time: {avg_time:.4f}s")
                 print(f"  Time variance: {max_time - min_time:.4f}s")
                 
@@ -822,6 +1231,8 @@ class ComprehensivePerformanceTest:
     
     def large_data_scalability_test(self):
         """Test scalability with large data sets (expanded, averaged) using SEGMENTED mode throughput"""
+        import psutil
+        
         print("\n📈 Large Data Scalability Test (Expanded, Averaged, Segmented Mode Only)")
         print("=" * 50)
         
@@ -836,6 +1247,9 @@ class ComprehensivePerformanceTest:
         ]
         num_repeats = 100
         
+        # Generate test data once; each size uses a prefix of it
+        random_data = _test_bytes(max(large_sizes))
+        
         results = {}
         
         for variant_name, cipher_class in self.variants.items():
@@ -845,38 +1259,48 @@ class ComprehensivePerformanceTest:
             try:
                 variant_results = {}
                 
+                # Get cipher in SEGMENTED mode only (shared by all sizes)
+                cipher = self._get_cipher(variant_name, OperationMode.SEGMENTED, key)
+                
                 for size in large_sizes:
                     mb_size = size // (1024 * 1024)
                     print(f"  Testing {mb_size}MB... (averaging {num_repeats} runs)")
                     
-                    # Generate large test data
-                    test_data = os.urandom(size)
+                    # Zero-copy view of the input, checked by digest after each round trip
+                    test_data = memoryview(random_data)[:size]
+                    expected_digest = _digest(test_data)
                     
-                    # Create cipher in SEGMENTED mode only
-                    cipher = cipher_class(key, OperationMode.SEGMENTED)
+                    # Output buffers reused by every repeat
+                    enc_buf = bytearray(size)
+                    dec_buf = bytearray(size)
                     
                     # Measure memory before
                     gc.collect()
                     mem_before = psutil.Process().memory_info().rss / (1024 * 1024)
                     
+                    # Trace the allocations of a first round trip, outside the timed runs
+                    traced = _trace_round_trip(cipher, test_data, enc_buf, dec_buf)
+                    
                     encrypt_times = []
                     decrypt_times = []
                     correct = True
                     for _ in range(num_repeats):
                         try:
                             # Encrypt
-                            start = time.perf_counter()
-                            encrypted = cipher.encrypt(test_data)
-                            encrypt_time = time.perf_counter() - start
+                            with _bench_env():
+                                start = time.perf_counter()
+                                encrypted = _encrypt_into(cipher, test_data, enc_buf)
+                                encrypt_time = time.perf_counter() - start
                             
                             # Decrypt
-                            start = time.perf_counter()
-                            decrypted = cipher.decrypt(encrypted)
-                            decrypt_time = time.perf_counter() - start
+                            with _bench_env():
+                                start = time.perf_counter()
+                                decrypted = _decrypt_into(cipher, encrypted, dec_buf)
+                                decrypt_time = time.perf_counter() - start
                             
                             encrypt_times.append(encrypt_time)
                             decrypt_times.append(decrypt_time)
-                            if test_data != decrypted:
+                            if _digest(decrypted) != expected_digest:
                                 correct = False
                         except Exception as e:
                             print(f"    ✗ ERROR: {e}")
@@ -900,13 +1324,16 @@ class ComprehensivePerformanceTest:
                         'correct': correct,
                         'memory_before': mem_before,
                         'memory_after': mem_after,
-                        'memory_growth': mem_after - mem_before
+                        'memory_growth': mem_after - mem_before,
+                        'traced_peak': traced['traced_peak'],
+                        'traced_current': traced['traced_current']
                     }
                     
                     print(f"    Encrypt: {avg_encrypt_time:.2f}s → {avg_encrypt_mbps:.1f} MB/s (avg)")
                     print(f"    Decrypt: {avg_decrypt_time:.2f}s → {avg_decrypt_mbps:.1f} MB/s (avg)")
                     print(f"    Correct: {correct}")
-                    print(f"    Memory growth: {mem_after - mem_before:.1f} MB")
+                    print(f"    Traced memory: {traced['traced_peak']:.1f} MB peak, {traced['traced_current']:.1f} MB retained")
+                    print(f"    RSS growth: {mem_after - mem_before:.1f} MB")
                 
                 results[variant_name] = variant_results
                 
@@ -919,6 +1346,9 @@ class ComprehensivePerformanceTest:
     
     def create_performance_visualizations(self):
         """Create matplotlib visualizations of performance results"""
+        # Imported here so the rest of the suite does not pay for matplotlib
+        import matplotlib.pyplot as plt
+        
         print("\n📊 Creating Performance Visualizations...")
         
         # Set up the plotting style
@@ -1167,6 +1597,9 @@ def run_all_comprehensive_tests():
     print("\n🚀 SINESCRAMBLE FULL FUNCTIONAL + PERFORMANCE SUITE\n" + "="*70)
     # Functional tests
     test_basic_encryption_decryption()
+    test_turbo_precompute()
+    test_batch_encryption()
+    test_encrypt_into()
     test_key_management()
     test_different_data_types()
     test_file_operations()
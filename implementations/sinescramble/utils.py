@@ -6,7 +6,8 @@ import random
 import json
 import base64
 import hashlib
-from typing import List
+import functools
+from typing import List, Tuple
 
 
 def generate_random_key(dimension: int, seed: int = None) -> List[float]:
@@ -51,11 +52,19 @@ def key_from_password(password: str, dimension: int) -> List[float]:
     # Convert hash to integer seed
     seed = int.from_bytes(password_hash[:8], byteorder='big')
     
-    # Generate deterministic key using the seed
-    random.seed(seed)
-    key = [random.uniform(-1000.0, 1000.0) for _ in range(dimension)]
+    return list(_key_from_seed(seed, dimension))
+
+
+@functools.lru_cache(maxsize=64)
+def _key_from_seed(seed: int, dimension: int) -> Tuple[float, ...]:
+    """
+    Generate the key for a password seed (cached on the seed, not the password)
     
-    return key
+    A generator of its own yields the same values as seeding the global one,
+    without disturbing the global random state.
+    """
+    rng = random.Random(seed)
+    return tuple(rng.uniform(-1000.0, 1000.0) for _ in range(dimension))
 
 
 def key_to_string(key: List[float]) -> str:
@@ -137,6 +146,7 @@ def estimate_security_level(key_dimension: int) -> str:
         return "Very High"
 
 
+@functools.lru_cache(maxsize=256)
 def recommend_mode_for_use_case(use_case: str) -> str:
     """
     Recommend operation mode based on use case